@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import time
@@ -39,6 +40,15 @@ type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
 
 
+@dataclass(slots=True)
+class AccessTokenCacheStats:
+    """Statistics of the verified access token cache."""
+
+    hits: int = 0
+    misses: int = 0
+    verification_time: float = 0.0
+
+
 class InvalidAuthError(Exception):
     """Raised when a authentication error occurs."""
 
@@ -185,6 +195,7 @@ class AuthManager:
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
         self._expire_callback: CALLBACK_TYPE | None = None
+        self._access_token_stats = AccessTokenCacheStats()
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
         )
@@ -647,6 +658,23 @@ class AuthManager:
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        stats = self._access_token_stats
+        if refresh_token := self._store.async_get_cached_access_token(token):
+            if not refresh_token.user.is_active:
+                return None
+            stats.hits += 1
+            return refresh_token
+
+        stats.misses += 1
+        start = time.perf_counter()
+        try:
+            return self._async_verify_access_token(token)
+        finally:
+            stats.verification_time += time.perf_counter() - start
+
+    @callback
+    def _async_verify_access_token(self, token: str) -> models.RefreshToken | None:
+        """Verify an access token and remember it until it expires."""
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -664,7 +692,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -673,8 +701,15 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if isinstance(expire_at := claims.get("exp"), int):
+            self._store.async_cache_access_token(token, refresh_token, expire_at)
         return refresh_token
 
+    @callback
+    def async_get_access_token_cache_stats(self) -> dict[str, Any]:
+        """Return the statistics of the verified access token cache."""
+        return asdict(self._access_token_stats)
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
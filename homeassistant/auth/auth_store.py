@@ -6,8 +6,11 @@ from datetime import timedelta
 import hmac
 import itertools
 from logging import getLogger
+import time
 from typing import Any
 
+from lru import LRU
+
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.storage import Store
@@ -42,6 +45,9 @@ INITIAL_LOAD_SAVE_DELAY = 300
 
 DEFAULT_SAVE_DELAY = 1
 
+# Number of verified access tokens kept in memory
+ACCESS_TOKEN_CACHE_SIZE = 256
+
 
 class AuthStore:
     """Stores authentication info.
@@ -63,6 +69,9 @@ class AuthStore:
             hass, STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
         )
         self._token_id_to_user_id: dict[str, str] = {}
+        self._access_token_cache: LRU[str, tuple[models.RefreshToken, float]] = LRU(
+            ACCESS_TOKEN_CACHE_SIZE
+        )
 
     async def async_get_groups(self) -> list[models.Group]:
         """Retrieve all users."""
@@ -143,6 +152,7 @@ class AuthStore:
         user = self._users.pop(user.id)
         for refresh_token_id in user.refresh_tokens:
             del self._token_id_to_user_id[refresh_token_id]
+        self._async_forget_access_tokens(set(user.refresh_tokens))
         user.refresh_tokens.clear()
         self._async_schedule_save()
 
@@ -240,8 +250,34 @@ class AuthStore:
         if user_id := self._token_id_to_user_id.get(refresh_token_id):
             del self._users[user_id].refresh_tokens[refresh_token_id]
             del self._token_id_to_user_id[refresh_token_id]
+            self._async_forget_access_tokens({refresh_token_id})
             self._async_schedule_save()
 
+    @callback
+    def async_get_cached_access_token(self, token: str) -> models.RefreshToken | None:
+        """Get the refresh token of a verified access token which did not expire."""
+        if (cached := self._access_token_cache.get(token)) is None:
+            return None
+        refresh_token, expire_at = cached
+        if expire_at <= time.time():
+            del self._access_token_cache[token]
+            return None
+        return refresh_token
+
+    @callback
+    def async_cache_access_token(
+        self, token: str, refresh_token: models.RefreshToken, expire_at: float
+    ) -> None:
+        """Remember a verified access token until it expires."""
+        self._access_token_cache[token] = (refresh_token, expire_at)
+
+    @callback
+    def _async_forget_access_tokens(self, refresh_token_ids: set[str]) -> None:
+        """Forget the verified access tokens of removed refresh tokens."""
+        for token, (refresh_token, _) in list(self._access_token_cache.items()):
+            if refresh_token.id in refresh_token_ids:
+                del self._access_token_cache[token]
+
     @callback
     def async_get_refresh_token(self, token_id: str) -> models.RefreshToken | None:
         """Get refresh token by id."""
@@ -253,6 +253,19 @@ PRELOAD_STORAGE = [
     "auth_module.totp",
 ]
 
+# Storage of the registries loaded by async_load_base_functionality
+PRELOAD_BASE_STORAGE = [
+    area_registry.STORAGE_KEY,
+    category_registry.STORAGE_KEY,
+    device_registry.STORAGE_KEY,
+    entity_registry.STORAGE_KEY,
+    floor_registry.STORAGE_KEY,
+    issue_registry.STORAGE_KEY,
+    label_registry.STORAGE_KEY,
+    restore_state.STORAGE_KEY,
+    config_entries.STORAGE_KEY,
+]
+
 
 async def async_setup_hass(
     runtime_config: RuntimeConfig,
@@ -423,8 +436,16 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
     translation.async_setup(hass)
     entity.async_setup(hass)
     template.async_setup(hass)
+    store_manager = get_internal_store_manager(hass)
+    await store_manager.async_initialize()
+    # Read the storage of the registries concurrently, the registries
+    # wait for the preload instead of reading the files one by one.
+    hass.async_create_background_task(
+        store_manager.async_preload(PRELOAD_BASE_STORAGE),
+        "preload base storage",
+        eager_start=True,
+    )
     await asyncio.gather(
-        create_eager_task(get_internal_store_manager(hass).async_initialize()),
         create_eager_task(area_registry.async_load(hass)),
         create_eager_task(category_registry.async_load(hass)),
         create_eager_task(device_registry.async_load(hass)),
@@ -1074,3 +1095,8 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        preload_time = get_internal_store_manager(hass).async_get_preload_timings()
+        _LOGGER.debug(
+            "Storage preload times: %s",
+            dict(sorted(preload_time.items(), key=itemgetter(1), reverse=True)),
+        )
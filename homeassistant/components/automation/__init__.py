@@ -70,6 +70,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reload import config_fingerprint
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -1046,7 +1047,9 @@ async def _async_process_config(
         automation_matches: set[int] = set()
         config_matches: set[int] = set()
         automation_configs_with_id: dict[str, tuple[int, AutomationEntityConfig]] = {}
-        automation_configs_without_id: list[tuple[int, AutomationEntityConfig]] = []
+        automation_configs_without_id: dict[
+            tuple[str, int | None], list[tuple[int, AutomationEntityConfig]]
+        ] = {}
 
         for config_idx, automation_config in enumerate(automation_configs):
             if automation_id := automation_config.config_block.get(CONF_ID):
@@ -1055,7 +1058,15 @@ async def _async_process_config(
                     automation_config,
                 )
                 continue
-            automation_configs_without_id.append((config_idx, automation_config))
+            # Bucket configurations without id by name and config fingerprint
+            # to avoid comparing every automation with every configuration
+            key = (
+                _automation_name(automation_config),
+                config_fingerprint(automation_config.raw_config),
+            )
+            automation_configs_without_id.setdefault(key, []).append(
+                (config_idx, automation_config)
+            )
 
         for automation_idx, automation in enumerate(automations):
             if automation.unique_id:
@@ -1069,13 +1080,15 @@ async def _async_process_config(
                     config_matches.add(config_idx)
                 continue
 
-            for config_idx, automation_config in automation_configs_without_id:
-                if config_idx in config_matches:
-                    # Only allow an automation config to match at most once
-                    continue
+            key = (str(automation.name), config_fingerprint(automation.raw_config))
+            if not (candidates := automation_configs_without_id.get(key)):
+                continue
+            for candidate_idx, (config_idx, automation_config) in enumerate(candidates):
                 if automation_matches_config(automation, automation_config):
                     automation_matches.add(automation_idx)
                     config_matches.add(config_idx)
+                    # Only allow an automation config to match at most once
+                    del candidates[candidate_idx]
                     # Only allow an automation to match at most once
                     break
 
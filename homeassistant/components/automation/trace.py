@@ -7,11 +7,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_enabled_reset, trace_enabled_set
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -58,7 +59,8 @@ def trace_automation(
 ) -> Generator[AutomationTrace]:
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    traced = async_start_trace(hass, trace, trace_config)
+    trace_enabled_token = trace_enabled_set(traced)
 
     try:
         yield trace
@@ -69,3 +71,5 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+        async_finish_trace(hass, trace, trace_config, traced)
+        trace_enabled_reset(trace_enabled_token)
@@ -69,6 +69,7 @@ from .api import (
     async_scanner_by_source,
     async_scanner_count,
     async_scanner_devices_by_address,
+    async_set_advertisement_rate_limit,
     async_set_fallback_availability_interval,
     async_track_unavailable,
 )
@@ -103,6 +104,7 @@ __all__ = [
     "async_rediscover_address",
     "async_register_callback",
     "async_register_scanner",
+    "async_set_advertisement_rate_limit",
     "async_set_fallback_availability_interval",
     "async_track_unavailable",
     "async_scanner_by_source",
@@ -213,3 +213,14 @@ def async_set_fallback_availability_interval(
 ) -> None:
     """Override the fallback availability timeout for a MAC address."""
     _get_manager(hass).async_set_fallback_availability_interval(address, interval)
+
+
+@hass_callback
+def async_set_advertisement_rate_limit(
+    hass: HomeAssistant, address: str, min_interval: float | None
+) -> None:
+    """Limit how often changed advertisements of a MAC address are dispatched.
+
+    A min_interval of None removes the rate limit.
+    """
+    _get_manager(hass).async_set_advertisement_rate_limit(address, min_interval)
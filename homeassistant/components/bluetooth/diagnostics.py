@@ -23,6 +23,7 @@ async def async_get_config_entry_diagnostics(
     diagnostics = {
         "manager": manager_diagnostics,
         "adapters": adapters,
+        "advertisements": manager.async_get_advertisement_stats(),
     }
     if platform.system() == "Linux":
         diagnostics["dbus"] = await get_dbus_managed_objects()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
 from functools import partial
 import itertools
 import logging
@@ -38,6 +40,35 @@ from .util import async_load_history_from_system
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class AdvertisementStats:
+    """Statistics of the advertisements received from a scanner.
+
+    Each received advertisement is either deduplicated, throttled or
+    dispatched. A throttled advertisement is counted as dispatched as well
+    if it is still the latest one when its rate limit interval has passed.
+    """
+
+    received: int = 0
+    deduplicated: int = 0
+    throttled: int = 0
+    dispatched: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return a dictionary representation of the statistics."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class _AddressRateLimit:
+    """Limit how often the advertisements of an address are dispatched."""
+
+    min_interval: float
+    last_dispatch: float | None = None
+    pending: BluetoothServiceInfoBleak | None = None
+    timer: asyncio.TimerHandle | None = None
+
+
 class HomeAssistantBluetoothManager(BluetoothManager):
     """Manage Bluetooth for Home Assistant."""
 
@@ -47,6 +78,9 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         "_integration_matcher",
         "_callback_index",
         "_cancel_logging_listener",
+        "_advertisement_stats",
+        "_advertisement_changed",
+        "_rate_limits",
     )
 
     def __init__(
@@ -63,6 +97,9 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         self._integration_matcher = integration_matcher
         self._callback_index = BluetoothCallbackMatcherIndex()
         self._cancel_logging_listener: CALLBACK_TYPE | None = None
+        self._advertisement_stats: dict[str, AdvertisementStats] = {}
+        self._advertisement_changed = False
+        self._rate_limits: dict[str, _AddressRateLimit] = {}
         super().__init__(bluetooth_adapters, slot_manager)
         self._async_logging_changed()
 
@@ -93,7 +130,66 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         if service_info := self._all_history.get(address):
             self._async_trigger_matching_discovery(service_info)
 
+    def scanner_adv_received(self, service_info: BluetoothServiceInfoBleak) -> None:
+        """Count an advertisement received from any scanner.
+
+        Advertisements which the base manager drops before they reach
+        _discover_service_info are counted as deduplicated. These are mostly
+        identical to the previous advertisement of the address, the others are
+        filtered or lose against a better advertisement from another scanner.
+        """
+        source = service_info.source
+        if (stats := self._advertisement_stats.get(source)) is None:
+            stats = self._advertisement_stats[source] = AdvertisementStats()
+        stats.received += 1
+        self._advertisement_changed = False
+        super().scanner_adv_received(service_info)
+        if not self._advertisement_changed:
+            stats.deduplicated += 1
+
     def _discover_service_info(self, service_info: BluetoothServiceInfoBleak) -> None:
+        """Dispatch an advertisement which changed since it was last seen.
+
+        The advertisements of an address with a rate limit are dispatched at
+        most once per interval, the latest advertisement received meanwhile is
+        dispatched when the interval has passed.
+        """
+        self._advertisement_changed = True
+        stats = self._advertisement_stats[service_info.source]
+        if rate_limit := self._rate_limits.get(service_info.address):
+            now = self.hass.loop.time()
+            if (
+                rate_limit.last_dispatch is not None
+                and now - rate_limit.last_dispatch < rate_limit.min_interval
+            ):
+                stats.throttled += 1
+                rate_limit.pending = service_info
+                if rate_limit.timer is None:
+                    rate_limit.timer = self.hass.loop.call_at(
+                        rate_limit.last_dispatch + rate_limit.min_interval,
+                        self._async_dispatch_pending,
+                        rate_limit,
+                    )
+                return
+            rate_limit.last_dispatch = now
+        stats.dispatched += 1
+        self._async_dispatch_service_info(service_info)
+
+    @hass_callback
+    def _async_dispatch_pending(self, rate_limit: _AddressRateLimit) -> None:
+        """Dispatch the latest advertisement held back by a rate limit."""
+        rate_limit.timer = None
+        if (service_info := rate_limit.pending) is None:
+            return
+        rate_limit.pending = None
+        rate_limit.last_dispatch = self.hass.loop.time()
+        self._advertisement_stats[service_info.source].dispatched += 1
+        self._async_dispatch_service_info(service_info)
+
+    def _async_dispatch_service_info(
+        self, service_info: BluetoothServiceInfoBleak
+    ) -> None:
+        """Dispatch an advertisement to the callbacks and matching domains."""
         matched_domains = self._integration_matcher.match_domains(service_info)
         if self._debug:
             _LOGGER.debug(
@@ -118,6 +214,31 @@ class HomeAssistantBluetoothManager(BluetoothManager):
                 service_info,
             )
 
+    @hass_callback
+    def async_set_advertisement_rate_limit(
+        self, address: str, min_interval: float | None
+    ) -> None:
+        """Set the minimum interval between dispatched advertisements of an address.
+
+        A min_interval of None removes the rate limit.
+        """
+        if rate_limit := self._rate_limits.pop(address, None):
+            if rate_limit.timer:
+                rate_limit.timer.cancel()
+            if service_info := rate_limit.pending:
+                self._advertisement_stats[service_info.source].dispatched += 1
+                self._async_dispatch_service_info(service_info)
+        if min_interval is not None:
+            self._rate_limits[address] = _AddressRateLimit(min_interval)
+
+    @hass_callback
+    def async_get_advertisement_stats(self) -> dict[str, dict[str, int]]:
+        """Return the statistics of the advertisements per scanner source."""
+        return {
+            source: stats.as_dict()
+            for source, stats in self._advertisement_stats.items()
+        }
+
     def _address_disappeared(self, address: str) -> None:
         """Dismiss all discoveries for the given address."""
         self._integration_matcher.async_clear_address(address)
@@ -192,6 +313,10 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         """Stop the Bluetooth integration at shutdown."""
         _LOGGER.debug("Stopping bluetooth manager")
         self._async_save_scanner_histories()
+        for rate_limit in self._rate_limits.values():
+            if rate_limit.timer:
+                rate_limit.timer.cancel()
+                rate_limit.timer = None
         super().async_stop()
         if self._cancel_logging_listener:
             self._cancel_logging_listener()
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 
 
 MAX_REMEMBER_ADDRESSES: Final = 2048
+MAX_MATCH_CACHE: Final = 1024
 
 CALLBACK: Final = "callback"
 DOMAIN: Final = "domain"
@@ -149,6 +150,13 @@ class IntegrationMatcher:
         return matched_domains
 
 
+# The fields of an advertisement which are checked by the matchers, the name
+# is None if no local name matcher can match it
+type _MatchFingerprint = tuple[
+    bool, str | None, tuple[str, ...], tuple[str, ...], tuple[tuple[int, bytes], ...]
+]
+
+
 class BluetoothMatcherIndexBase[
     _T: (BluetoothMatcher, BluetoothCallbackMatcherWithCallback)
 ]:
@@ -160,6 +168,11 @@ class BluetoothMatcherIndexBase[
 
     This is optimized for cases when no service infos will be matched in
     any bucket and we can quickly reject the service info as not matching.
+
+    Many devices send advertisements with the same matchable fields, so the
+    matches of service infos which are not rejected are cached by a
+    fingerprint of those fields. The cache is cleared when a matcher is
+    added or removed.
     """
 
     __slots__ = (
@@ -170,6 +183,8 @@ class BluetoothMatcherIndexBase[
         "service_uuid_set",
         "service_data_uuid_set",
         "manufacturer_id_set",
+        "manufacturer_data_start_length",
+        "_match_cache",
     )
 
     def __init__(self) -> None:
@@ -181,6 +196,8 @@ class BluetoothMatcherIndexBase[
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
+        self.manufacturer_data_start_length = 0
+        self._match_cache: LRU[_MatchFingerprint, tuple[_T, ...]] = LRU(MAX_MATCH_CACHE)
 
     def add(self, matcher: _T) -> bool:
         """Add a matcher to the index.
@@ -189,6 +206,12 @@ class BluetoothMatcherIndexBase[
 
         We put them in the bucket that they are most likely to match.
         """
+        self._match_cache.clear()
+        if manufacturer_data_start := matcher.get(MANUFACTURER_DATA_START):
+            self.manufacturer_data_start_length = max(
+                self.manufacturer_data_start_length, len(manufacturer_data_start)
+            )
+
         # Local name is the cheapest to match since its just a dict lookup
         if LOCAL_NAME in matcher:
             self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].append(
@@ -217,6 +240,7 @@ class BluetoothMatcherIndexBase[
         Matchers only end up in one bucket, so once we have
         removed one, we are done.
         """
+        self._match_cache.clear()
         if LOCAL_NAME in matcher:
             self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].remove(
                 matcher
@@ -245,6 +269,45 @@ class BluetoothMatcherIndexBase[
 
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
         """Check for a match."""
+        name = service_info.name
+        local_name_match = bool(
+            name and self.local_name.get(name[:LOCAL_NAME_MIN_MATCH_LENGTH])
+        )
+        if not (
+            local_name_match
+            or (
+                self.service_data_uuid_set
+                and not self.service_data_uuid_set.isdisjoint(service_info.service_data)
+            )
+            or (
+                self.manufacturer_id_set
+                and not self.manufacturer_id_set.isdisjoint(
+                    service_info.manufacturer_data
+                )
+            )
+            or (
+                self.service_uuid_set
+                and not self.service_uuid_set.isdisjoint(service_info.service_uuids)
+            )
+        ):
+            return []
+        manufacturer_data_start_length = self.manufacturer_data_start_length
+        fingerprint: _MatchFingerprint = (
+            service_info.connectable,
+            name if local_name_match else None,
+            tuple(service_info.service_uuids),
+            tuple(service_info.service_data),
+            tuple(
+                (manufacturer_id, data[:manufacturer_data_start_length])
+                for manufacturer_id, data in service_info.manufacturer_data.items()
+            ),
+        )
+        if (cached := self._match_cache.get(fingerprint)) is None:
+            cached = self._match_cache[fingerprint] = tuple(self._match(service_info))
+        return list(cached)
+
+    def _match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
+        """Check for a match against the index."""
         matches: list[_T] = []
         if (name := service_info.name) and (
             local_name_matchers := self.local_name.get(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 from datetime import timedelta
 from functools import cache
@@ -342,6 +343,7 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
                 self.restore_data[restore_key] = processor.data.async_get_restore_data()
 
             self._processors.remove(processor)
+            processor.async_cancel_pending_update()
 
         self._processors.append(processor)
         return remove_processor
@@ -401,6 +403,12 @@ class PassiveBluetoothDataProcessor[_T, _DataT]:
     should be updated. The coordinator will then dispatch subscribers based
     on the data in the PassiveBluetoothDataUpdate object. The accumulated data
     is available in the devices, entity_data, and entity_descriptions attributes.
+
+    Devices which advertise many times a second can pass min_update_interval
+    to limit how often subscribers are updated. Changes received within the
+    interval after an update are accumulated and the subscribers of the
+    changed entities are updated once the interval has passed. Changes to
+    the devices and changes in availability are dispatched right away.
     """
 
     coordinator: PassiveBluetoothProcessorCoordinator[_DataT]
@@ -415,6 +423,7 @@ class PassiveBluetoothDataProcessor[_T, _DataT]:
         self,
         update_method: Callable[[_DataT], PassiveBluetoothDataUpdate[_T]],
         restore_key: str | None = None,
+        min_update_interval: float | None = None,
     ) -> None:
         """Initialize the coordinator."""
         try:
@@ -430,6 +439,10 @@ class PassiveBluetoothDataProcessor[_T, _DataT]:
         ] = {}
         self.update_method = update_method
         self.last_update_success = True
+        self.min_update_interval = min_update_interval
+        self._last_listener_update: float | None = None
+        self._pending_entity_keys: set[PassiveBluetoothEntityKey] | None = None
+        self._pending_update: asyncio.TimerHandle | None = None
 
     @callback
     def async_register_coordinator(
@@ -467,8 +480,59 @@ class PassiveBluetoothDataProcessor[_T, _DataT]:
     @callback
     def async_handle_unavailable(self) -> None:
         """Handle the device going unavailable."""
+        self.async_cancel_pending_update()
         self.async_update_listeners(None)
 
+    @callback
+    def async_cancel_pending_update(self) -> None:
+        """Cancel the update of the changes held back by min_update_interval."""
+        if self._pending_update:
+            self._pending_update.cancel()
+            self._pending_update = None
+        self._pending_entity_keys = None
+
+    @callback
+    def _async_update_pending(self) -> None:
+        """Update the listeners of the changes held back by min_update_interval."""
+        self._pending_update = None
+        if (changed_entity_keys := self._pending_entity_keys) is None:
+            return
+        self._pending_entity_keys = None
+        self._last_listener_update = self.coordinator.hass.loop.time()
+        self.async_update_listeners(self.data, True, changed_entity_keys)
+
+    @callback
+    def _async_hold_back_update(
+        self,
+        was_available: bool,
+        changed_entity_keys: set[PassiveBluetoothEntityKey] | None,
+    ) -> bool:
+        """Return if the update is held back by min_update_interval."""
+        if TYPE_CHECKING:
+            assert self.min_update_interval is not None
+        loop = self.coordinator.hass.loop
+        if not was_available or changed_entity_keys is None:
+            # All listeners are updated so nothing is held back anymore
+            self.async_cancel_pending_update()
+            self._last_listener_update = loop.time()
+            return False
+        if self._pending_entity_keys is not None:
+            self._pending_entity_keys |= changed_entity_keys
+            return True
+        if not changed_entity_keys:
+            return False
+        now = loop.time()
+        if (
+            last_update := self._last_listener_update
+        ) is not None and now - last_update < self.min_update_interval:
+            self._pending_entity_keys = changed_entity_keys
+            self._pending_update = loop.call_at(
+                last_update + self.min_update_interval, self._async_update_pending
+            )
+            return True
+        self._last_listener_update = now
+        return False
+
     @callback
     def async_add_entities_listener(
         self,
@@ -594,6 +658,11 @@ class PassiveBluetoothDataProcessor[_T, _DataT]:
             )
 
         changed_entity_keys = self.data.update(new_data)
+        if self.min_update_interval is not None:
+            if was_available is None:
+                was_available = self.coordinator.available
+            if self._async_hold_back_update(was_available, changed_entity_keys):
+                return
         self.async_update_listeners(new_data, was_available, changed_entity_keys)
 
 
@@ -19,6 +19,7 @@ from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
     integration_platform,
+    poll_scheduler,
 )
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.json import (
@@ -209,6 +210,7 @@ async def _async_get_json_file_response(
         "custom_components": custom_components,
         "integration_manifest": async_format_manifest(integration.manifest),
         "setup_times": async_get_domain_setup_times(hass, domain),
+        "pollers": poll_scheduler.async_get(hass).async_get_stats(d_id),
         "data": data,
     }
     try:
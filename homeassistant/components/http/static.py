@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+import time
 from typing import Final
 
+from aiohttp import hdrs
 from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.helpers import ETag
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -17,9 +25,227 @@ CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
 
+# Files up to this size are kept in memory, larger files are sent from disk
+# with sendfile
+HOT_CACHE_MAX_FILE_SIZE = 256 * 1024
+# Total size in bytes of the files kept in memory
+HOT_CACHE_MAX_SIZE = 16 * 1024 * 1024
+# Seconds after which a file kept in memory is read from disk again
+HOT_CACHE_TTL = 10
+# Precompressed variants which are served in the order of preference
+ENCODING_EXTENSIONS: Final = (("br", ".br"), ("gzip", ".gz"))
+# Requests with these headers are handled by FileResponse
+_FILE_RESPONSE_HEADERS: Final = (
+    hdrs.RANGE,
+    hdrs.IF_RANGE,
+    hdrs.IF_MATCH,
+    hdrs.IF_UNMODIFIED_SINCE,
+)
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> tuple[tuple[str, str], ...]:
+    """Return the precompressed variants accepted by a client.
+
+    The variants are ordered by the q-value the client gives their encoding,
+    then by ENCODING_EXTENSIONS. Encodings with a q-value of 0 are not
+    accepted, encodings which are not listed get the q-value of *.
+    """
+    qvalues: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        if not (coding := coding.strip()):
+            continue
+        qvalue = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[coding] = qvalue
+    wildcard = qvalues.get("*", 0.0)
+    accepted = [
+        (qvalue, encoding, extension)
+        for encoding, extension in ENCODING_EXTENSIONS
+        if (qvalue := qvalues.get(encoding, wildcard)) > 0
+    ]
+    accepted.sort(key=lambda item: -item[0])
+    return tuple((encoding, extension) for _, encoding, extension in accepted)
+
+
+@dataclass(slots=True, frozen=True)
+class _HotFileVariant:
+    """A file or a precompressed variant of it kept in memory."""
+
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+
+@dataclass(slots=True)
+class _HotFile:
+    """The variants of a file kept in memory.
+
+    A variant is None if it does not exist or is too large to be kept
+    in memory.
+    """
+
+    expires: float
+    size: int = 0
+    variants: dict[str, _HotFileVariant | None] = field(default_factory=dict)
+    loading: dict[str, asyncio.Future[_HotFileVariant | None]] = field(
+        default_factory=dict
+    )
+
+
+class _HotCache:
+    """Files kept in memory, bounded by the total size of their variants.
+
+    The least recently used files are dropped when the size is exceeded.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.size = 0
+        self._files: OrderedDict[Path, _HotFile] = OrderedDict()
+
+    def __contains__(self, path: Path) -> bool:
+        """Return if a file is kept in memory."""
+        return path in self._files
+
+    def get(self, path: Path) -> _HotFile | None:
+        """Return a file kept in memory and mark it as recently used."""
+        if (hot_file := self._files.get(path)) is not None:
+            self._files.move_to_end(path)
+        return hot_file
+
+    def set(self, path: Path, hot_file: _HotFile) -> None:
+        """Keep a file in memory, replacing the previous one."""
+        if (previous := self._files.pop(path, None)) is not None:
+            self.size -= previous.size
+        self._files[path] = hot_file
+        self.size += hot_file.size
+
+    def set_variant(
+        self,
+        path: Path,
+        hot_file: _HotFile,
+        encoding: str,
+        variant: _HotFileVariant | None,
+    ) -> None:
+        """Store a variant of a file and drop files if the cache is too large."""
+        hot_file.variants[encoding] = variant
+        if variant is None:
+            return
+        hot_file.size += len(variant.body)
+        # The file may have been dropped or replaced while the variant was read
+        if self._files.get(path) is not hot_file:
+            return
+        self.size += len(variant.body)
+        while self.size > self.max_size:
+            _, dropped = self._files.popitem(last=False)
+            self.size -= dropped.size
+
+    def clear(self) -> None:
+        """Drop all files."""
+        self._files.clear()
+        self.size = 0
+
+
+HOT_CACHE = _HotCache(HOT_CACHE_MAX_SIZE)
+
+
+def _read_variant(path: Path) -> _HotFileVariant | None:
+    """Read a file if it exists and is small enough to keep in memory."""
+    try:
+        with path.open("rb") as file:
+            stat = path.stat()
+            if stat.st_size > HOT_CACHE_MAX_FILE_SIZE:
+                return None
+            body = file.read()
+    except OSError:
+        return None
+    return _HotFileVariant(
+        body,
+        f"{stat.st_mtime_ns:x}-{stat.st_size:x}",
+        # Last-Modified has a resolution of one second
+        datetime.fromtimestamp(int(stat.st_mtime), UTC),
+    )
+
+
+async def _async_get_variant(
+    hot_file: _HotFile, file_path: Path, encoding: str, extension: str
+) -> _HotFileVariant | None:
+    """Return a variant of a file, reading it from disk if needed."""
+    if encoding in hot_file.variants:
+        return hot_file.variants[encoding]
+    # Requests which arrive while the variant is read wait for the same read
+    if (future := hot_file.loading.get(encoding)) is None:
+        loop = asyncio.get_running_loop()
+        future = hot_file.loading[encoding] = loop.run_in_executor(
+            None, _read_variant, file_path.with_name(file_path.name + extension)
+        )
+        future.add_done_callback(lambda _: hot_file.loading.pop(encoding, None))
+    variant = await future
+    if encoding not in hot_file.variants:
+        HOT_CACHE.set_variant(file_path, hot_file, encoding, variant)
+    return variant
+
+
+async def _async_hot_response(
+    request: Request, file_path: Path, content_type: str
+) -> Response | None:
+    """Return a response for a file kept in memory.
+
+    Returns None if the file has to be sent from disk.
+    """
+    now = time.monotonic()
+    if (hot_file := HOT_CACHE.get(file_path)) is None or hot_file.expires < now:
+        hot_file = _HotFile(now + HOT_CACHE_TTL)
+        HOT_CACHE.set(file_path, hot_file)
+
+    encoding = ""
+    variant: _HotFileVariant | None = None
+    for candidate, extension in _accepted_encodings(
+        request.headers.get(hdrs.ACCEPT_ENCODING, "")
+    ):
+        if variant := await _async_get_variant(
+            hot_file, file_path, candidate, extension
+        ):
+            encoding = candidate
+            break
+    if variant is None and not (
+        variant := await _async_get_variant(hot_file, file_path, "", "")
+    ):
+        return None
+
+    if (if_none_match := request.if_none_match) is not None:
+        not_modified = any(etag.value in (variant.etag, "*") for etag in if_none_match)
+    elif (if_modified_since := request.if_modified_since) is not None:
+        not_modified = variant.last_modified <= if_modified_since
+    else:
+        not_modified = False
+
+    response = Response(status=304) if not_modified else Response(body=variant.body)
+    response.etag = ETag(value=variant.etag)
+    response.last_modified = variant.last_modified
+    response.headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+    if not not_modified:
+        response.headers[CONTENT_TYPE] = content_type
+        if encoding:
+            response.headers[hdrs.CONTENT_ENCODING] = encoding
+    return response
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Small files which are requested again are served from memory, including
+    their precompressed br and gzip variants.
+    """
 
     async def _handle(self, request: Request) -> StreamResponse:
         """Wrap base handler to cache file path resolution and content type guess."""
@@ -29,8 +255,16 @@ class CachingStaticResource(StaticResource):
 
         if key in RESPONSE_CACHE:
             file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
+            hot_response: Response | None = None
+            if not any(header in request.headers for header in _FILE_RESPONSE_HEADERS):
+                hot_response = await _async_hot_response(
+                    request, file_path, content_type
+                )
+            if hot_response is not None:
+                response = hot_response
+            else:
+                response = FileResponse(file_path, chunk_size=self._chunk_size)
+                response.headers[CONTENT_TYPE] = content_type
         else:
             response = await super()._handle(request)
             if not isinstance(response, FileResponse):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
-from dataclasses import dataclass
-from functools import lru_cache, partial
+from dataclasses import dataclass, field
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -117,6 +117,9 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Seconds over which the publish throughput is calculated
+PUBLISH_THROUGHPUT_WINDOW = 60
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -267,12 +270,146 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+@dataclass(slots=True)
+class PublishStats:
+    """Statistics of the messages published with a QoS level."""
+
+    pending: int = 0
+    published: int = 0
+    timeouts: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    completed: deque[float] = field(default_factory=deque)
+
+    def record(self, start: float, now: float) -> None:
+        """Record a message which was published."""
+        latency = now - start
+        self.published += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.completed.append(now)
+        self.expire(now)
+
+    def expire(self, now: float) -> None:
+        """Forget messages which were published before the throughput window."""
+        completed = self.completed
+        while completed and completed[0] < now - PUBLISH_THROUGHPUT_WINDOW:
+            completed.popleft()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        self.expire(time.monotonic())
+        return {
+            "pending": self.pending,
+            "published": self.published,
+            "timeouts": self.timeouts,
+            "latency_avg": self.latency_total / self.published
+            if self.published
+            else 0.0,
+            "latency_max": self.latency_max,
+            "throughput": len(self.completed) / PUBLISH_THROUGHPUT_WINDOW,
+        }
+
+
+class _TopicNode:
+    """A topic level in the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the topic level."""
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Match topics against wildcard subscriptions.
+
+    Each level of a subscription topic is a node in the trie, so matching
+    a topic only walks the levels of the topic and the + and # wildcards
+    instead of testing every subscription.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the subscription trie."""
+        self._root = _TopicNode()
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription is unknown.
+        """
+        path: list[tuple[_TopicNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the levels which are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription to the exact subscription topic."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards on the first level don't match topics starting with $
+        match_root_wildcards = not topic.startswith("$")
+        matches: list[Subscription] = []
+        nodes = [(self._root, 0)]
+        while nodes:
+            node, index = nodes.pop()
+            children = node.children
+            wildcards = index > 0 or match_root_wildcards
+            # A # also matches the parent level
+            if wildcards and (multi_level := children.get("#")) is not None:
+                matches.extend(multi_level.subscriptions)
+            if index == last:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                nodes.append((child, index + 1))
+            if wildcards and (single_level := children.get("+")) is not None:
+                nodes.append((single_level, index + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,7 +513,7 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -388,6 +525,7 @@ class MQTT:
 
         self._connection_lock = asyncio.Lock()
         self._pending_operations: dict[int, asyncio.Future[None]] = {}
+        self._publish_stats = {qos: PublishStats() for qos in (0, 1, 2)}
         self._subscribe_debouncer = EnsureJobAfterCooldown(
             INITIAL_SUBSCRIBE_COOLDOWN, self._async_perform_subscriptions
         )
@@ -624,14 +762,19 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
         self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
     ) -> None:
-        """Publish a MQTT message."""
+        """Publish a MQTT message.
+
+        Messages published in the same iteration of the event loop are written
+        to the socket together. Messages with QoS 0 are not acknowledged by the
+        broker, so only messages with QoS 1 or 2 are waited for.
+        """
         msg_info = self._mqttc.publish(topic, payload, qos, retain)
         _LOGGER.debug(
             "Transmitting%s message on %s: '%s', mid: %s, qos: %s",
@@ -641,7 +784,34 @@ class MQTT:
             msg_info.mid,
             qos,
         )
-        await self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc)
+        future = self._async_get_mid_future_or_raise(msg_info.mid, msg_info.rc)
+        stats = self._publish_stats[qos]
+        stats.pending += 1
+        future.add_done_callback(
+            partial(self._async_publish_done, stats, time.monotonic())
+        )
+        if qos:
+            await self._async_wait_for_mid_future(future)
+
+    @callback
+    def _async_publish_done(
+        self, stats: PublishStats, start: float, future: asyncio.Future[None]
+    ) -> None:
+        """Update the publish statistics when a message is published."""
+        stats.pending -= 1
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            stats.timeouts += 1
+            return
+        stats.record(start, time.monotonic())
+
+    @callback
+    def async_get_publish_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of the published messages per QoS level."""
+        return {
+            f"qos_{qos}": stats.as_dict() for qos, stats in self._publish_stats.items()
+        }
 
     async def async_connect(self, client_available: asyncio.Future[bool]) -> None:
         """Connect to the host. Does not process messages yet."""
@@ -741,15 +911,12 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
@@ -761,8 +928,6 @@ class MQTT:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -835,11 +1000,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -851,7 +1014,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1044,18 +1206,10 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        subscriptions = self._wildcard_subscriptions.matches(topic)
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
         return subscriptions
 
     @callback
@@ -1085,7 +1239,9 @@ class MQTT:
             msg.payload[0:8192],
         )
         subscriptions = self._matching_subscriptions(topic)
-        msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        msg_cache: dict[tuple[str, str | None], ReceiveMessage] = {}
+        # Decode the payload once per encoding so subscribers share it
+        payload_by_encoding: dict[str, SubscribePayloadType | None] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1097,10 +1253,13 @@ class MQTT:
                 self._retained_topics[subscription].add(topic)
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            if (encoding := subscription.encoding) is not None:
+                if encoding not in payload_by_encoding:
+                    try:
+                        payload_by_encoding[encoding] = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        payload_by_encoding[encoding] = None
+                if (decoded_payload := payload_by_encoding[encoding]) is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
@@ -1109,10 +1268,12 @@ class MQTT:
                         subscription.job,
                     )
                     continue
+                payload = decoded_payload
             subscription_topic = subscription.topic
-            if subscription_topic not in msg_cache_by_subscription_topic:
+            cache_key = (subscription_topic, encoding)
+            if cache_key not in msg_cache:
                 # Only make one copy of the message
-                # per topic so we avoid storing a separate
+                # per topic and encoding so we avoid storing a separate
                 # dataclass in memory for each subscriber
                 # to the same topic for retained messages
                 receive_msg = ReceiveMessage(
@@ -1123,9 +1284,9 @@ class MQTT:
                     subscription_topic,
                     msg.timestamp,
                 )
-                msg_cache_by_subscription_topic[subscription_topic] = receive_msg
+                msg_cache[cache_key] = receive_msg
             else:
-                receive_msg = msg_cache_by_subscription_topic[subscription_topic]
+                receive_msg = msg_cache[cache_key]
             job = subscription.job
             if job.job_type is HassJobType.Callback:
                 # We do not wrap Callback jobs in catch_log_exception since
@@ -1204,8 +1365,11 @@ class MQTT:
         if not future.done():
             future.set_exception(asyncio.TimeoutError)
 
-    async def _async_wait_for_mid_or_raise(self, mid: int, result_code: int) -> None:
-        """Wait for ACK from broker or raise on error."""
+    @callback
+    def _async_get_mid_future_or_raise(
+        self, mid: int, result_code: int
+    ) -> asyncio.Future[None]:
+        """Return the future for the ACK of a mid or raise on error."""
         if result_code != 0:
             # pylint: disable-next=import-outside-toplevel
             import paho.mqtt.client as mqtt
@@ -1215,19 +1379,36 @@ class MQTT:
             )
 
         # Create the mid event if not created, either _mqtt_handle_mid or
-        # _async_wait_for_mid_or_raise may be executed first.
+        # _async_get_mid_future_or_raise may be executed first.
         future = self._async_get_mid_future(mid)
         loop = self.hass.loop
         timer_handle = loop.call_later(TIMEOUT_ACK, self._async_timeout_mid, future)
-        try:
-            await future
-        except TimeoutError:
+        future.add_done_callback(partial(self._async_mid_done, mid, timer_handle))
+        return future
+
+    @callback
+    def _async_mid_done(
+        self, mid: int, timer_handle: asyncio.TimerHandle, future: asyncio.Future[None]
+    ) -> None:
+        """Stop tracking a mid when it is acknowledged, timed out or cancelled."""
+        timer_handle.cancel()
+        if self._pending_operations.get(mid) is future:
+            del self._pending_operations[mid]
+        if not future.cancelled() and isinstance(future.exception(), TimeoutError):
             _LOGGER.warning(
                 "No ACK from MQTT server in %s seconds (mid: %s)", TIMEOUT_ACK, mid
             )
-        finally:
-            timer_handle.cancel()
-            del self._pending_operations[mid]
+
+    async def _async_wait_for_mid_future(self, future: asyncio.Future[None]) -> None:
+        """Wait for ACK from broker."""
+        with contextlib.suppress(TimeoutError):
+            await future
+
+    async def _async_wait_for_mid_or_raise(self, mid: int, result_code: int) -> None:
+        """Wait for ACK from broker or raise on error."""
+        await self._async_wait_for_mid_future(
+            self._async_get_mid_future_or_raise(mid, result_code)
+        )
 
     async def _discovery_cooldown(self) -> None:
         """Wait until all discovery and subscriptions are processed."""
@@ -1247,13 +1428,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -56,7 +56,7 @@ TOPIC_MATCHER = re.compile(
 MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_updated_{}_{}"
 )
-MQTT_DISCOVERY_NEW: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
+MQTT_DISCOVERY_NEW: SignalTypeFormat[list[MQTTDiscoveryPayload]] = SignalTypeFormat(
     "mqtt_discovery_new_{}_{}"
 )
 MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
@@ -192,29 +192,63 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # Discovered components which are added together per platform
+    discovery_batches: dict[str, list[MQTTDiscoveryPayload]] = {}
 
     @callback
-    def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
-        """Add a component from a discovery message."""
-        discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
-        component, discovery_id = discovery_hash
-        message = f"Found new component: {component} {discovery_id}"
-        async_log_discovery_origin_info(message, discovery_payload)
-        mqtt_data.discovery_already_discovered.add(discovery_hash)
+    def _async_queue_component(
+        component: str, discovery_payload: MQTTDiscoveryPayload
+    ) -> None:
+        """Queue a discovered component to be added with the rest of its batch.
+
+        Discovery messages arrive in bursts, for example the retained messages
+        sent by the broker after subscribing. The components discovered in the
+        same iteration of the event loop, or while their platform is set up,
+        are added with a single dispatch per platform.
+        """
+        if (batch := discovery_batches.get(component)) is not None:
+            batch.append(discovery_payload)
+            return
+        discovery_batches[component] = [discovery_payload]
+        if component in mqtt_data.platforms_loaded:
+            # Not started eagerly, so the messages of the current socket read
+            # are added to the batch first
+            config_entry.async_create_task(
+                hass, _async_add_components_later(component), eager_start=False
+            )
+        else:
+            config_entry.async_create_task(hass, _async_component_setup(component))
+
+    @callback
+    def _async_add_components(component: str) -> None:
+        """Add the components of a batch."""
+        if not (discovery_payloads := discovery_batches.pop(component, None)):
+            return
+        for discovery_payload in discovery_payloads:
+            discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
+            message = f"Found new component: {component} {discovery_hash[1]}"
+            async_log_discovery_origin_info(message, discovery_payload)
+            mqtt_data.discovery_already_discovered.add(discovery_hash)
         async_dispatcher_send(
-            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
+            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payloads
         )
 
-    async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
-    ) -> None:
-        """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
-            if component not in mqtt_data.platforms_loaded:
-                await async_forward_entry_setup_and_setup_discovery(
-                    hass, config_entry, {component}
-                )
-        _async_add_component(discovery_payload)
+    async def _async_add_components_later(component: str) -> None:
+        """Add the components of a batch after the pending messages."""
+        _async_add_components(component)
+
+    async def _async_component_setup(component: str) -> None:
+        """Perform component set up and add the components queued meanwhile."""
+        try:
+            async with platform_setup_lock.setdefault(component, asyncio.Lock()):
+                if component not in mqtt_data.platforms_loaded:
+                    await async_forward_entry_setup_and_setup_discovery(
+                        hass, config_entry, {component}
+                    )
+        except BaseException:
+            discovery_batches.pop(component, None)
+            raise
+        _async_add_components(component)
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
@@ -238,7 +272,6 @@ async def async_start(  # noqa: C901
             return
 
         component, node_id, object_id = match.groups()
-
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -322,9 +355,7 @@ async def async_start(  # noqa: C901
 
         if component not in mqtt_data.platforms_loaded and payload:
             # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+            _async_queue_component(component, payload)
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
@@ -333,7 +364,7 @@ async def async_start(  # noqa: C901
                 hass, MQTT_DISCOVERY_UPDATED.format(*discovery_hash), payload
             )
         elif payload:
-            _async_add_component(payload)
+            _async_queue_component(component, payload)
         else:
             # Unhandled discovery message
             async_dispatcher_send(
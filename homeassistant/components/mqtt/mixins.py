@@ -217,22 +217,31 @@ def async_setup_non_entity_entry_helper(
     mqtt_data = hass.data[DATA_MQTT]
 
     async def _async_setup_non_entity_entry_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
+        discovery_payloads: list[MQTTDiscoveryPayload],
     ) -> None:
-        """Set up an MQTT entity, automation or tag from discovery."""
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
-        try:
-            config: ConfigType = discovery_schema(discovery_payload)
-            await async_setup(config, discovery_data=discovery_payload.discovery_data)
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
+        """Set up MQTT automations or tags from discovery.
+
+        An unexpected error is raised after the other items are set up.
+        """
+        error: Exception | None = None
+        for discovery_payload in discovery_payloads:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            try:
+                config: ConfigType = discovery_schema(discovery_payload)
+                await async_setup(
+                    config, discovery_data=discovery_payload.discovery_data
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception as err:  # noqa: BLE001
+                _handle_discovery_failure(hass, discovery_payload)
+                error = error or err
+        if error is not None:
+            raise error
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
@@ -259,29 +268,40 @@ def async_setup_entity_entry_helper(
 
     @callback
     def _async_setup_entity_entry_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
+        discovery_payloads: list[MQTTDiscoveryPayload],
     ) -> None:
-        """Set up an MQTT entity from discovery."""
+        """Set up MQTT entities from discovery.
+
+        The entities of a discovery batch are validated and added together. An
+        unexpected error is raised after the other entities are added.
+        """
         nonlocal entity_class
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
-        try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
-            if schema_class_mapping is not None:
-                entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-            if TYPE_CHECKING:
-                assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
+        entities: list[Entity] = []
+        error: Exception | None = None
+        for discovery_payload in discovery_payloads:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            try:
+                config: DiscoveryInfoType = discovery_schema(discovery_payload)
+                if schema_class_mapping is not None:
+                    entity_class = schema_class_mapping[config[CONF_SCHEMA]]
+                if TYPE_CHECKING:
+                    assert entity_class is not None
+                entities.append(
+                    entity_class(hass, config, entry, discovery_payload.discovery_data)
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception as err:  # noqa: BLE001
+                _handle_discovery_failure(hass, discovery_payload)
+                error = error or err
+        if entities:
+            async_add_entities(entities)
+        if error is not None:
+            raise error
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
@@ -8,6 +8,7 @@ from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -24,6 +25,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, JsonValueType, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -48,9 +50,23 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
 
+# Number of decoded JSON payloads which are kept for other subscribers
+PAYLOAD_JSON_CACHE_SIZE = 64
+
 type PublishPayloadType = str | bytes | int | float | None
 
 
+@lru_cache(maxsize=PAYLOAD_JSON_CACHE_SIZE)
+def cached_json_loads(payload: str) -> JsonValueType:
+    """Decode a JSON payload.
+
+    The result is shared by all subscribers which decode the same payload and
+    is read-only. It is only passed to templates, which can't modify it; use
+    json_loads for results which are stored or modified.
+    """
+    return json_loads(payload)
+
+
 def convert_outgoing_mqtt_payload(
     payload: PublishPayloadType,
 ) -> PublishPayloadType:
@@ -300,6 +316,12 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        if isinstance(payload, str):
+            try:  # noqa: SIM105 - suppress is much slower
+                values["value_json"] = cached_json_loads(payload)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
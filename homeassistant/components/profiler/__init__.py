@@ -17,14 +17,18 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import discovery_flow, loop_monitor, storage
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.service import (
+    async_get_entity_service_stats,
+    async_register_admin_service,
+)
 
 from .const import DOMAIN
 
@@ -65,6 +69,8 @@ SERVICES = (
     SERVICE_LOG_CURRENT_TASKS,
 )
 
+PLATFORMS = [Platform.SENSOR]
+
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
@@ -382,11 +388,21 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    loop_monitor.async_get(hass).async_start()
+    websocket_api.async_register_command(hass, websocket_loop_stats)
+    websocket_api.async_register_command(hass, websocket_discovery_stats)
+    websocket_api.async_register_command(hass, websocket_storage_stats)
+    websocket_api.async_register_command(hass, websocket_service_stats)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    loop_monitor.async_get(hass).async_stop()
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
@@ -395,6 +411,52 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/loop_stats"})
+@callback
+def websocket_loop_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the event loop latency and the slowest event listeners."""
+    monitor = loop_monitor.async_get(hass)
+    if not monitor.running:
+        connection.send_error(msg["id"], "not_running", "Loop monitor is not running")
+        return
+    connection.send_result(msg["id"], monitor.async_get_stats())
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/discovery_stats"})
+@callback
+def websocket_discovery_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the discoveries and the discovery flows per source."""
+    connection.send_result(
+        msg["id"], discovery_flow.async_get_cache(hass).async_get_stats()
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/storage_stats"})
+@callback
+def websocket_storage_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the writes and the bytes written per store."""
+    connection.send_result(msg["id"], storage.async_get_write_stats(hass))
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/service_stats"})
+@callback
+def websocket_service_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the latency of the entity services."""
+    connection.send_result(msg["id"], async_get_entity_service_stats(hass))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
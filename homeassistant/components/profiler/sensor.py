@@ -0,0 +1,91 @@
+"""Sensors exposing the event loop monitor of the profiler."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import loop_monitor
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopMonitorSensorEntityDescription(SensorEntityDescription):
+    """Describes a loop monitor sensor."""
+
+    value_fn: Callable[[loop_monitor.LoopMonitor], float | int]
+
+
+SENSORS: tuple[LoopMonitorSensorEntityDescription, ...] = (
+    LoopMonitorSensorEntityDescription(
+        key="event_loop_lag",
+        translation_key="event_loop_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda monitor: monitor.async_get_lag()["p95"] * 1000,
+    ),
+    LoopMonitorSensorEntityDescription(
+        key="slow_callbacks",
+        translation_key="slow_callbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda monitor: monitor.slow_callbacks,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the platform from config_entry."""
+    monitor = loop_monitor.async_get(hass)
+    async_add_entities(
+        (LoopMonitorSensor(entry, monitor, description) for description in SENSORS),
+        True,
+    )
+
+
+class LoopMonitorSensor(SensorEntity):
+    """Representation of a loop monitor sensor."""
+
+    entity_description: LoopMonitorSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        monitor: loop_monitor.LoopMonitor,
+        description: LoopMonitorSensorEntityDescription,
+    ) -> None:
+        """Initialize the loop monitor sensor."""
+        self.entity_description = description
+        self._monitor = monitor
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            name=entry.title,
+            identifiers={(DOMAIN, entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def async_update(self) -> None:
+        """Update the sensor from the loop monitor."""
+        self._attr_native_value = self.entity_description.value_fn(self._monitor)
@@ -382,17 +382,23 @@ async def _async_process_config(
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        script_configs_by_key: dict[str, tuple[int, ScriptEntityConfig]] = {
+            script_config.key: (config_idx, script_config)
+            for config_idx, script_config in enumerate(script_configs)
+        }
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, script_config in enumerate(script_configs):
-                if config_idx in config_matches:
-                    # Only allow a script config to match at most once
-                    continue
-                if script_matches_config(script, script_config):
-                    script_matches.add(script_idx)
-                    config_matches.add(config_idx)
-                    # Only allow a script to match at most once
-                    break
+            # Scripts are keyed by their object id, look up the configuration
+            # instead of comparing every script with every configuration
+            if (
+                script.unique_id is None
+                or script.unique_id not in script_configs_by_key
+            ):
+                continue
+            config_idx, script_config = script_configs_by_key.pop(script.unique_id)
+            if script_matches_config(script, script_config):
+                script_matches.add(script_idx)
+                config_matches.add(config_idx)
 
         return script_matches, config_matches
 
@@ -88,23 +88,40 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
     """Process config."""
-    coordinators: list[TriggerUpdateCoordinator] | None = hass.data.pop(DOMAIN, None)
+    coordinators: list[TriggerUpdateCoordinator] = hass.data.pop(DOMAIN, [])
+    kept_coordinators: list[TriggerUpdateCoordinator] = []
+    new_conf_sections: list[ConfigType] = []
+
+    # Keep coordinators of unchanged trigger based sections, so their triggers
+    # stay attached and in-flight actions are not interrupted by a reload
+    for conf_section in hass_config[DOMAIN]:
+        if CONF_TRIGGER not in conf_section:
+            continue
+        for idx, coordinator in enumerate(coordinators):
+            if coordinator.config == conf_section:
+                kept_coordinators.append(coordinators.pop(idx))
+                break
+        else:
+            new_conf_sections.append(conf_section)
 
     # Remove old ones
-    if coordinators:
-        for coordinator in coordinators:
-            coordinator.async_remove()
+    for coordinator in coordinators:
+        coordinator.async_remove()
 
     async def init_coordinator(hass, conf_section):
         coordinator = TriggerUpdateCoordinator(hass, conf_section)
         await coordinator.async_setup(hass_config)
         return coordinator
 
-    coordinator_tasks = []
+    coordinator_tasks = [
+        init_coordinator(hass, conf_section) for conf_section in new_conf_sections
+    ]
+
+    for coordinator in kept_coordinators:
+        coordinator.async_load_platforms(hass_config)
 
     for conf_section in hass_config[DOMAIN]:
         if CONF_TRIGGER in conf_section:
-            coordinator_tasks.append(init_coordinator(hass, conf_section))
             continue
 
         for platform_domain in PLATFORMS:
@@ -124,4 +141,7 @@ async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
                 )
 
     if coordinator_tasks:
-        hass.data[DOMAIN] = await asyncio.gather(*coordinator_tasks)
+        kept_coordinators.extend(await asyncio.gather(*coordinator_tasks))
+
+    if kept_coordinators:
+        hass.data[DOMAIN] = kept_coordinators
@@ -50,6 +50,15 @@ class TriggerUpdateCoordinator(DataUpdateCoordinator):
                 EVENT_HOMEASSISTANT_START, self._attach_triggers
             )
 
+        self.async_load_platforms(hass_config)
+
+    @callback
+    def async_load_platforms(self, hass_config: ConfigType) -> None:
+        """Create entities for the configured platforms.
+
+        Also used on reload to recreate the entities of an unchanged config
+        section, without detaching and attaching its triggers again.
+        """
         for platform_domain in PLATFORMS:
             if platform_domain in self.config:
                 self.hass.async_create_task(
@@ -19,11 +19,19 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_STORED_TRACES,
+    TRACE_MODE_FULL,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODES,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -35,7 +43,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL): vol.In(TRACE_MODES),
+    vol.Optional(
+        CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL
+    ): cv.positive_int,
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -51,6 +63,7 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -148,6 +161,44 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> bool:
+    """Start tracing a run according to the trace mode.
+
+    Returns True if the run is traced in full, in which case the trace is stored
+    right away. Runs which are not traced in full should not record any trace
+    elements.
+    With the sampled trace mode every sample_interval-th run is traced in full, a
+    sample_interval of 0 only keeps the traces of runs ending with an error.
+    """
+    if (mode := trace_config[CONF_TRACE_MODE]) == TRACE_MODE_SAMPLED:
+        runs: dict[str, int] = hass.data[DATA_TRACE_RUNS]
+        run = runs[trace.key] = runs.get(trace.key, 0) + 1
+        interval: int = trace_config[CONF_SAMPLE_INTERVAL]
+        traced = interval > 0 and (run - 1) % interval == 0
+    else:
+        traced = mode != TRACE_MODE_OFF
+
+    if traced:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    return traced
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType, traced: bool
+) -> None:
+    """Store the trace of a sampled run which was not traced if it failed."""
+    if (
+        not traced
+        and trace_config[CONF_TRACE_MODE] == TRACE_MODE_SAMPLED
+        and trace.has_error
+    ):
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -1,7 +1,16 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_SAMPLE_INTERVAL = "sample_interval"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_MODE = "mode"
 DATA_TRACE = "trace"
+DATA_TRACE_RUNS = "trace_runs"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_INTERVAL = 10  # Trace every 10th run in sampled mode
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+TRACE_MODE_FULL = "full"  # Trace every run
+TRACE_MODE_OFF = "off"  # Don't trace
+TRACE_MODE_SAMPLED = "sampled"  # Trace every nth run and runs ending with an error
+TRACE_MODES = [TRACE_MODE_FULL, TRACE_MODE_OFF, TRACE_MODE_SAMPLED]
@@ -80,6 +80,11 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def has_error(self) -> bool:
+        """Return if the run ended with an error."""
+        return self._error is not None or self._script_execution == "error"
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
@@ -29,6 +29,7 @@ import logging
 import os
 import pathlib
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -206,11 +207,14 @@ _LOGGER = logging.getLogger(__name__)
 
 @functools.lru_cache(MAX_EXPECTED_ENTITY_IDS)
 def split_entity_id(entity_id: str) -> tuple[str, str]:
-    """Split a state entity ID into domain and object ID."""
+    """Split a state entity ID into domain and object ID.
+
+    The domain is interned so all states of a domain share the same string.
+    """
     domain, _, object_id = entity_id.partition(".")
     if not domain or not object_id:
         raise ValueError(f"Invalid entity ID {entity_id}")
-    return domain, object_id
+    return sys.intern(domain), object_id
 
 
 _OBJECT_ID = r"(?!_)[\da-z_]+(?<!_)"
@@ -1405,6 +1409,8 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+_JobMonitorType = Callable[[EventType[Any] | str, HassJob[..., Any], float], None]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1444,7 +1450,15 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_job_monitor",
+        "_job_monitor_countdown",
+        "_job_monitor_sample_rate",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1454,6 +1468,9 @@ class EventBus:
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
+        self._job_monitor: _JobMonitorType | None = None
+        self._job_monitor_countdown = 0
+        self._job_monitor_sample_rate = 0
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
 
@@ -1462,6 +1479,21 @@ class EventBus:
         """Handle logging change."""
         self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
+    @callback
+    def async_set_job_monitor(
+        self,
+        job_monitor: _JobMonitorType | None,
+        sample_rate: int = 1,
+    ) -> None:
+        """Set a callback receiving the event type and run time of listener jobs.
+
+        Only one out of every sample_rate listener jobs is timed.
+
+        This method must be run in the event loop.
+        """
+        self._job_monitor = job_monitor
+        self._job_monitor_sample_rate = self._job_monitor_countdown = sample_rate
+
     @callback
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
@@ -1558,10 +1590,38 @@ class EventBus:
                     context,
                 )
 
+            if self._job_monitor is not None:
+                self._async_run_monitored_job(event_type, job, event)
+                continue
+
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
+    def _async_run_monitored_job(
+        self,
+        event_type: EventType[Any] | str,
+        job: HassJob[[Event[Any]], Coroutine[Any, Any, None] | None],
+        event: Event[Any],
+    ) -> None:
+        """Run a listener job and report its run time if it is sampled."""
+        self._job_monitor_countdown -= 1
+        if self._job_monitor_countdown:
             try:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
+            return
+
+        self._job_monitor_countdown = self._job_monitor_sample_rate
+        start = monotonic()
+        try:
+            self._hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception("Error running job: %s", job)
+        if self._job_monitor is not None:
+            self._job_monitor(event_type, job, monotonic() - start)
 
     def listen(
         self,
@@ -1979,6 +2039,10 @@ class State:
         self.context = Context(
             self.context.user_id, self.context.parent_id, self.context.id
         )
+        # The compressed forms are only sent for current states, drop them
+        # so old states kept around by listeners don't hold on to them.
+        self.__dict__.pop("as_compressed_state", None)
+        self.__dict__.pop("as_compressed_state_json", None)
 
     def __repr__(self) -> str:
         """Return the representation of the states."""
@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Coroutine
+from dataclasses import dataclass, field
+import time
 from typing import Any, NamedTuple
 
-from homeassistant.config_entries import ConfigFlowResult
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+    ConfigFlowResult,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import gather_with_limited_concurrency
 from homeassistant.util.hass_dict import HassKey
 
+from .dispatcher import async_dispatcher_connect
+from .singleton import singleton
+
 FLOW_INIT_LIMIT = 20
 DISCOVERY_FLOW_DISPATCHER: HassKey[FlowDispatcher] = HassKey(
     "discovery_flow_dispatcher"
 )
+DISCOVERY_FLOW_CACHE: HassKey[DiscoveryFlowCache] = HassKey("discovery_flow_cache")
+
+# Seconds during which a discovery which was aborted because the device is
+# already configured is not started again with the same data
+CONFIGURED_DISCOVERY_TTL = 900
+# Seconds over which the rate of discoveries is calculated
+DISCOVERY_RATE_WINDOW = 60
 
 
 @bind_hass
@@ -24,6 +44,9 @@ def async_create_flow(
     hass: HomeAssistant, domain: str, context: dict[str, Any], data: Any
 ) -> None:
     """Create a discovery flow."""
+    if async_get_cache(hass).async_discovered(domain, context, data):
+        return
+
     dispatcher: FlowDispatcher | None = None
     if DISCOVERY_FLOW_DISPATCHER in hass.data:
         dispatcher = hass.data[DISCOVERY_FLOW_DISPATCHER]
@@ -50,13 +73,158 @@ def _async_init_flow(
     # as ones in progress as it may cause additional device probing
     # which can overload devices since zeroconf/ssdp updates can happen
     # multiple times in the same minute
+    if hass.is_stopping:
+        return None
+    if hass.config_entries.flow.async_has_matching_flow(domain, context, data):
+        async_get_cache(hass).async_record_skipped(context["source"])
+        return None
+
+    return _async_init_discovery_flow(hass, domain, context, data)
+
+
+async def _async_init_discovery_flow(
+    hass: HomeAssistant, domain: str, context: dict[str, Any], data: Any
+) -> ConfigFlowResult:
+    """Init a discovery flow and remember if the device is already configured."""
+    cache = async_get_cache(hass)
+    cache.async_record_started(context["source"])
+    result = await hass.config_entries.flow.async_init(
+        domain, context=context, data=data
+    )
     if (
-        hass.config_entries.flow.async_has_matching_flow(domain, context, data)
-        or hass.is_stopping
+        isinstance(result, dict)
+        and result.get("type") is FlowResultType.ABORT
+        and result.get("reason") == "already_configured"
     ):
-        return None
+        cache.async_add_configured(domain, context, data)
+    return result
+
+
+@dataclass(slots=True)
+class DiscoveryStats:
+    """Statistics of the discoveries of a source."""
+
+    discovered: int = 0
+    flows_started: int = 0
+    skipped: int = 0
+    recent: deque[float] = field(default_factory=deque)
+
+    def record(self, now: float) -> None:
+        """Record a discovery."""
+        self.discovered += 1
+        self.recent.append(now)
+        self.expire(now)
+
+    def expire(self, now: float) -> None:
+        """Forget discoveries from before the rate window."""
+        recent = self.recent
+        while recent and recent[0] < now - DISCOVERY_RATE_WINDOW:
+            recent.popleft()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        self.expire(time.monotonic())
+        return {
+            "discovered": self.discovered,
+            "flows_started": self.flows_started,
+            "skipped": self.skipped,
+            "rate": len(self.recent) / DISCOVERY_RATE_WINDOW,
+        }
+
+
+class DiscoveryFlowCache:
+    """Remember discoveries of devices which are already configured.
+
+    Devices announce themselves again and again, and each announcement
+    would start a flow which is aborted as the device is already configured.
+    A flow is not started again for the same discovery data until the
+    discovery expires or a config entry of the domain is removed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._configured: dict[tuple[str, str], list[tuple[Any, float]]] = {}
+        self._stats: dict[str, DiscoveryStats] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Set up the cache."""
+        async_dispatcher_connect(
+            self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed
+        )
+
+    @callback
+    def _async_config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Forget the discoveries of a domain when one of its entries is removed."""
+        if change is not ConfigEntryChange.REMOVED:
+            return
+        for key in [key for key in self._configured if key[0] == entry.domain]:
+            del self._configured[key]
+
+    @callback
+    def _async_get_stats(self, source: str) -> DiscoveryStats:
+        """Return the statistics of a source."""
+        if (stats := self._stats.get(source)) is None:
+            stats = self._stats[source] = DiscoveryStats()
+        return stats
+
+    @callback
+    def async_discovered(self, domain: str, context: dict[str, Any], data: Any) -> bool:
+        """Record a discovery and return if it is already configured."""
+        source = context["source"]
+        stats = self._async_get_stats(source)
+        now = time.monotonic()
+        stats.record(now)
+        if not (configured := self._configured.get((domain, source))):
+            return False
+        configured[:] = [item for item in configured if item[1] > now]
+        if not any(configured_data == data for configured_data, _ in configured):
+            return False
+        # A discovery reloads the entries which are waiting to retry their setup
+        if any(
+            entry.state is ConfigEntryState.SETUP_RETRY
+            for entry in self.hass.config_entries.async_entries(domain)
+        ):
+            return False
+        stats.skipped += 1
+        return True
+
+    @callback
+    def async_add_configured(
+        self, domain: str, context: dict[str, Any], data: Any
+    ) -> None:
+        """Remember a discovery of a device which is already configured."""
+        now = time.monotonic()
+        configured = self._configured.setdefault((domain, context["source"]), [])
+        configured[:] = [item for item in configured if item[1] > now]
+        configured.append((data, now + CONFIGURED_DISCOVERY_TTL))
 
-    return hass.config_entries.flow.async_init(domain, context=context, data=data)
+    @callback
+    def async_record_started(self, source: str) -> None:
+        """Record a flow started by a discovery."""
+        self._async_get_stats(source).flows_started += 1
+
+    @callback
+    def async_record_skipped(self, source: str) -> None:
+        """Record a discovery skipped because a matching flow is in progress."""
+        self._async_get_stats(source).skipped += 1
+
+    @callback
+    def async_get_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of the discoveries per source."""
+        return {source: stats.as_dict() for source, stats in self._stats.items()}
+
+
+@callback
+@singleton(DISCOVERY_FLOW_CACHE)
+def async_get_cache(hass: HomeAssistant) -> DiscoveryFlowCache:
+    """Get the discovery flow cache."""
+    cache = DiscoveryFlowCache(hass)
+    cache.async_setup()
+    return cache
 
 
 class PendingFlowKey(NamedTuple):
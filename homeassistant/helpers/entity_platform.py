@@ -41,6 +41,7 @@ from homeassistant.util.hass_dict import HassKey
 from . import (
     device_registry as dev_reg,
     entity_registry as ent_reg,
+    poll_scheduler,
     service,
     translation,
 )
@@ -144,8 +145,8 @@ class EntityPlatform:
         self._tasks: list[asyncio.Task[None]] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_polling_timer: asyncio.TimerHandle | None = None
+        # Method to cancel the scheduled poll
+        self._async_polling_timer: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -659,18 +660,30 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
+        self._async_schedule_poll()
+
+    @property
+    def _poller_name(self) -> str:
+        """Return the name of the platform in the poll scheduler."""
+        if self.config_entry:
+            return f"{self.domain}.{self.platform_name}.{self.config_entry.entry_id}"
+        return f"{self.domain}.{self.platform_name}"
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Schedule the next poll of the entity states."""
+        self._async_polling_timer = poll_scheduler.async_get(self.hass).async_schedule(
+            id(self),
+            self._poller_name,
             self.scan_interval_seconds,
             self._async_handle_interval_callback,
+            self.config_entry.entry_id if self.config_entry else None,
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        self._async_schedule_poll()
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -937,8 +950,9 @@ class EntityPlatform:
     def async_unsub_polling(self) -> None:
         """Stop polling."""
         if self._async_polling_timer is not None:
-            self._async_polling_timer.cancel()
+            self._async_polling_timer()
             self._async_polling_timer = None
+            poll_scheduler.async_get(self.hass).async_remove_poller(id(self))
 
     @callback
     def async_prepare(self) -> None:
@@ -1016,7 +1030,9 @@ class EntityPlatform:
         """
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
+        scheduler = poll_scheduler.async_get(self.hass)
         if self._process_updates.locked():
+            scheduler.async_record_overrun(id(self))
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -1025,26 +1041,32 @@ class EntityPlatform:
             )
             return
 
+        start = self.hass.loop.time()
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+            try:
+                await self._async_update_polling_entities()
+            finally:
+                scheduler.async_record_run(id(self), self.hass.loop.time() - start)
+
+    async def _async_update_polling_entities(self) -> None:
+        """Update the states of the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
 
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
-                )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        if tasks := [
+            create_eager_task(entity.async_update_ha_state(True), loop=self.hass.loop)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -699,6 +699,35 @@ def async_track_state_removed_domain(
     )
 
 
+_KEYED_TRACKERS: tuple[_KeyedEventTracker[Any], ...] = (
+    _KEYED_TRACK_STATE_CHANGE,
+    _KEYED_TRACK_STATE_REPORT,
+    _KEYED_TRACK_ENTITY_REGISTRY_UPDATED,
+    _KEYED_TRACK_DEVICE_REGISTRY_UPDATED,
+    _KEYED_TRACK_STATE_ADDED_DOMAIN,
+    _KEYED_TRACK_STATE_REMOVED_DOMAIN,
+)
+
+
+@callback
+def async_get_keyed_listener_counts(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the number of keys and listeners of each keyed event tracker.
+
+    Each keyed tracker listens on the bus once and dispatches by key, so its
+    listeners don't show up in the bus listener counts.
+    """
+    counts: dict[str, dict[str, Any]] = {}
+    for tracker in _KEYED_TRACKERS:
+        if (event_data := hass.data.get(tracker.key)) is None:
+            continue
+        counts[str(tracker.key)] = {
+            "event_type": tracker.event_type,
+            "keys": len(event_data.callbacks),
+            "listeners": sum(len(jobs) for jobs in event_data.callbacks.values()),
+        }
+    return counts
+
+
 @callback
 def _async_string_to_lower_list(instr: str | Iterable[str]) -> list[str]:
     if isinstance(instr, str):
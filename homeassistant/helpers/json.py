@@ -197,6 +197,21 @@ def save_json(
     atomic_writes: bool = False,
 ) -> None:
     """Save JSON data to a file."""
+    json_data, mode = serialize_json_for_file(filename, data, encoder=encoder)
+    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
+    method(filename, json_data, private, mode=mode)
+
+
+def serialize_json_for_file(
+    filename: str,
+    data: list | dict,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+) -> tuple[str | bytes, str]:
+    """Serialize data to be saved to a JSON file.
+
+    Returns the serialized data and the mode to open the file with.
+    """
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -220,8 +235,7 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
-    method(filename, json_data, private, mode=mode)
+    return json_data, mode
 
 
 def find_paths_unserializable_data(
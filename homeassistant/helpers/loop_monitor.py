@@ -0,0 +1,213 @@
+"""Monitor the latency of the event loop and the run time of event listeners."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from statistics import quantiles
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.util.event_type import EventType
+from homeassistant.util.hass_dict import HassKey
+
+from .event import async_get_keyed_listener_counts
+from .singleton import singleton
+
+DATA_LOOP_MONITOR: HassKey[LoopMonitor] = HassKey("loop_monitor")
+
+# Seconds between probes of the event loop latency
+PROBE_INTERVAL = 1.0
+# Number of latency probes kept
+LAG_WINDOW = 300
+# Time one out of this many event listener jobs
+SAMPLE_RATE = 10
+# Upper bounds in seconds of the run time histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+_BUCKET_LABELS = (*(str(bucket) for bucket in BUCKETS), "+Inf")
+# Run time in seconds above which a listener job counts as slow
+SLOW_CALLBACK_DURATION = 0.1
+
+
+def _job_source(job: HassJob[..., Any]) -> tuple[str, str | None]:
+    """Return the name of the target of a job and the integration it belongs to."""
+    target: Any = job.target
+    while isinstance(target, partial):
+        target = target.func
+    module: str = getattr(target, "__module__", None) or "unknown"
+    qualname = getattr(target, "__qualname__", None) or type(target).__qualname__
+    parts = module.split(".")
+    integration: str | None = None
+    if parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        integration = parts[2]
+    elif parts[0] == "custom_components" and len(parts) > 1:
+        integration = parts[1]
+    return f"{module}.{qualname}", integration
+
+
+@dataclass(slots=True)
+class ListenerStats:
+    """Run time statistics of an event listener."""
+
+    integration: str | None
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS) + 1))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "integration": self.integration,
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "histogram": dict(zip(_BUCKET_LABELS, self.histogram, strict=True)),
+        }
+
+
+@dataclass(slots=True)
+class EventTypeStats:
+    """Run time statistics of the listeners of an event type."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def as_dict(self, listeners: int) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "listeners": listeners,
+            "sampled": self.count,
+            "total": self.total,
+            "max": self.max,
+        }
+
+
+class LoopMonitor:
+    """Monitor the event loop.
+
+    The latency of the loop is probed at a fixed interval and a sample of the
+    event listener jobs is timed and attributed to the listener.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loop monitor."""
+        self.hass = hass
+        self.slow_callbacks = 0
+        self._lag: deque[float] = deque(maxlen=LAG_WINDOW)
+        self._listeners: dict[str, ListenerStats] = {}
+        self._event_types: dict[EventType[Any] | str, EventTypeStats] = {}
+        self._probe: asyncio.TimerHandle | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the monitor is running."""
+        return self._probe is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring."""
+        if self._probe is not None:
+            return
+        self._async_schedule_probe()
+        self.hass.bus.async_set_job_monitor(self._async_record_job, SAMPLE_RATE)
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_stop_event
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop monitoring."""
+        if self._unsub_stop:
+            self._unsub_stop()
+        self._async_stop_event()
+
+    @callback
+    def _async_stop_event(self, event: Event | None = None) -> None:
+        """Stop monitoring when Home Assistant stops."""
+        self._unsub_stop = None
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        self.hass.bus.async_set_job_monitor(None)
+
+    @callback
+    def _async_schedule_probe(self) -> None:
+        """Schedule the next latency probe."""
+        loop = self.hass.loop
+        expected = loop.time() + PROBE_INTERVAL
+        self._probe = loop.call_at(expected, self._async_run_probe, expected)
+
+    @callback
+    def _async_run_probe(self, expected: float) -> None:
+        """Record how late the probe ran."""
+        self._lag.append(max(self.hass.loop.time() - expected, 0.0))
+        self._async_schedule_probe()
+
+    @callback
+    def _async_record_job(
+        self, event_type: EventType[Any] | str, job: HassJob[..., Any], duration: float
+    ) -> None:
+        """Record the run time of an event listener job."""
+        if (event_stats := self._event_types.get(event_type)) is None:
+            event_stats = self._event_types[event_type] = EventTypeStats()
+        event_stats.count += 1
+        event_stats.total += duration
+        event_stats.max = max(event_stats.max, duration)
+
+        name, integration = _job_source(job)
+        if (stats := self._listeners.get(name)) is None:
+            stats = self._listeners[name] = ListenerStats(integration)
+        stats.count += 1
+        stats.total += duration
+        stats.max = max(stats.max, duration)
+        stats.histogram[bisect_left(BUCKETS, duration)] += 1
+        if duration > SLOW_CALLBACK_DURATION:
+            self.slow_callbacks += 1
+
+    @callback
+    def async_get_lag(self) -> dict[str, float]:
+        """Return the latency of the event loop in seconds."""
+        if not self._lag:
+            return {"current": 0.0, "max": 0.0, "p50": 0.0, "p95": 0.0}
+        if len(self._lag) > 1:
+            percentiles = quantiles(self._lag, n=20, method="inclusive")
+            p50, p95 = percentiles[9], percentiles[18]
+        else:
+            p50 = p95 = self._lag[0]
+        return {"current": self._lag[-1], "max": max(self._lag), "p50": p50, "p95": p95}
+
+    @callback
+    def async_get_stats(self, limit: int = 50) -> dict[str, Any]:
+        """Return the statistics of the event loop and the slowest listeners."""
+        listeners = sorted(
+            self._listeners.items(), key=lambda item: item[1].max, reverse=True
+        )
+        listener_counts = self.hass.bus.async_listeners()
+        return {
+            "lag": self.async_get_lag(),
+            "sample_rate": SAMPLE_RATE,
+            "slow_callbacks": self.slow_callbacks,
+            "event_types": {
+                str(event_type): self._event_types.get(
+                    event_type, EventTypeStats()
+                ).as_dict(count)
+                for event_type, count in listener_counts.items()
+                if count
+            },
+            "keyed_listeners": async_get_keyed_listener_counts(self.hass),
+            "listeners": {name: stats.as_dict() for name, stats in listeners[:limit]},
+        }
+
+
+@callback
+@singleton(DATA_LOOP_MONITOR)
+def async_get(hass: HomeAssistant) -> LoopMonitor:
+    """Get the loop monitor."""
+    return LoopMonitor(hass)
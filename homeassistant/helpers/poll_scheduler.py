@@ -0,0 +1,192 @@
+"""Shared scheduler for polling entity platforms and data update coordinators."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+import logging
+import math
+from typing import Any
+from zlib import crc32
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .event import RANDOM_MICROSECOND_MAX, RANDOM_MICROSECOND_MIN
+from .singleton import singleton
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey("poll_scheduler")
+
+# Polls are due on ticks of 1/SLOTS seconds and polls which are due on the
+# same tick share a single timer. The first poll of a poller is delayed by one
+# of SLOTS offsets in the stagger window to spread pollers which start together.
+SLOTS = 10
+_SLOT_MIN = RANDOM_MICROSECOND_MIN / 10**6
+_SLOT_WIDTH = (RANDOM_MICROSECOND_MAX - RANDOM_MICROSECOND_MIN) / 10**6 / (SLOTS - 1)
+
+
+def poll_offset(name: str) -> float:
+    """Return the offset by which the first poll of a poller is delayed.
+
+    The offset is derived from the name of the poller so it stays the same
+    between restarts while different pollers are spread over the slots.
+    """
+    return _SLOT_MIN + (crc32(name.encode()) % SLOTS) * _SLOT_WIDTH
+
+
+@dataclass(slots=True)
+class PollerStats:
+    """Statistics of a poller."""
+
+    name: str
+    config_entry_id: str | None = None
+    interval: float = 0.0
+    runs: int = 0
+    overruns: int = 0
+    last_delay: float = 0.0
+    max_delay: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return asdict(self)
+
+
+@dataclass(slots=True, eq=False)
+class _ScheduledPoll:
+    """A poll waiting for its slot."""
+
+    poller_id: int
+    name: str
+    action: Callable[[], None]
+
+
+@dataclass(slots=True)
+class _Slot:
+    """Polls which are due at the same time."""
+
+    handle: asyncio.TimerHandle
+    polls: list[_ScheduledPoll] = field(default_factory=list)
+
+
+class PollScheduler:
+    """Schedule polls so they are spread over each second.
+
+    The first poll of a poller is delayed by an offset picked from the name of
+    the poller, so pollers which start together don't all fire at the same
+    moment. Polls are never due before their delay has passed and are rounded
+    up to the next tick, so pollers which are due together run from a single
+    timer.
+
+    Pollers are identified by an id which is unique while they poll, for
+    example the id of the coordinator or platform object. The name is only
+    used as a label and to pick the offset.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the poll scheduler."""
+        self.hass = hass
+        self._slots: dict[int, _Slot] = {}
+        self._stats: dict[int, PollerStats] = {}
+
+    @callback
+    def async_schedule(
+        self,
+        poller_id: int,
+        name: str,
+        delay: float,
+        action: Callable[[], None],
+        config_entry_id: str | None = None,
+    ) -> CALLBACK_TYPE:
+        """Run action once in about delay seconds.
+
+        Returns a callable to cancel the poll.
+        """
+        loop = self.hass.loop
+        due = loop.time() + delay
+        if (stats := self._stats.get(poller_id)) is None:
+            due += poll_offset(name)
+            stats = self._stats[poller_id] = PollerStats(name)
+        stats.config_entry_id = config_entry_id
+        stats.interval = delay
+        tick = math.ceil(due * SLOTS)
+        poll = _ScheduledPoll(poller_id, name, action)
+        if (slot := self._slots.get(tick)) is None:
+            slot = self._slots[tick] = _Slot(
+                loop.call_at(max(tick / SLOTS, due), self._async_run_slot, tick)
+            )
+        slot.polls.append(poll)
+
+        @callback
+        def _async_cancel() -> None:
+            """Cancel the poll."""
+            if (slot := self._slots.get(tick)) is None or poll not in slot.polls:
+                return
+            slot.polls.remove(poll)
+            if not slot.polls:
+                slot.handle.cancel()
+                del self._slots[tick]
+
+        return _async_cancel
+
+    @callback
+    def _async_run_slot(self, tick: int) -> None:
+        """Run the polls which are due."""
+        if (slot := self._slots.pop(tick, None)) is None:
+            return
+        delay = max(self.hass.loop.time() - slot.handle.when(), 0.0)
+        for poll in slot.polls:
+            if (stats := self._stats.get(poll.poller_id)) is not None:
+                stats.last_delay = delay
+                stats.max_delay = max(stats.max_delay, delay)
+            try:
+                poll.action()
+            except Exception:
+                _LOGGER.exception("Error running poll for %s", poll.name)
+
+    @callback
+    def async_remove_poller(self, poller_id: int) -> None:
+        """Drop the statistics of a poller which stopped polling.
+
+        The pending poll of the poller must be cancelled by the caller.
+        """
+        self._stats.pop(poller_id, None)
+
+    @callback
+    def async_record_run(self, poller_id: int, duration: float) -> None:
+        """Record a completed poll."""
+        if (stats := self._stats.get(poller_id)) is None:
+            return
+        stats.runs += 1
+        stats.last_duration = duration
+        stats.max_duration = max(stats.max_duration, duration)
+        stats.total_duration += duration
+
+    @callback
+    def async_record_overrun(self, poller_id: int) -> None:
+        """Record a poll which took longer than the interval of the poller."""
+        if (stats := self._stats.get(poller_id)) is not None:
+            stats.overruns += 1
+
+    @callback
+    def async_get_stats(
+        self, config_entry_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the statistics of all pollers or those of a config entry."""
+        return [
+            stats.as_dict()
+            for stats in self._stats.values()
+            if config_entry_id is None or stats.config_entry_id == config_entry_id
+        ]
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get(hass: HomeAssistant) -> PollScheduler:
+    """Get the poll scheduler."""
+    return PollScheduler(hass)
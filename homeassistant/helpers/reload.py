@@ -13,10 +13,12 @@ from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from .entity import Entity
 from .entity_component import EntityComponent
 from .entity_platform import EntityPlatform, async_get_platforms
+from .json import json_dumps_sorted
 from .service import async_register_admin_service
 from .typing import ConfigType
 
@@ -186,6 +188,22 @@ def async_get_platform_without_config_entry(
     return None
 
 
+def config_fingerprint(config: Any) -> int | None:
+    """Return a fingerprint of a raw configuration block.
+
+    Integrations which only recreate changed items on reload use this to find the
+    existing item a configuration may belong to, instead of comparing every
+    configuration with every item. Equal configurations have equal fingerprints,
+    callers must still compare the configurations to rule out collisions.
+
+    Returns None if the configuration can't be serialized.
+    """
+    try:
+        return hash(json_dumps_sorted(config))
+    except JSON_ENCODE_EXCEPTIONS:
+        return None
+
+
 async def async_setup_reload_service(
     hass: HomeAssistant, domain: str, platforms: Iterable[str]
 ) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
@@ -12,13 +13,13 @@ from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.util.hass_dict import HassKey
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads
 
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -35,6 +36,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of a dumped state which did not change is kept
+# before it is updated. This avoids rewriting unchanged states on every dump.
+LAST_SEEN_REFRESH_INTERVAL = timedelta(hours=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -96,6 +101,15 @@ class StoredState:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class _DumpedState:
+    """A stored state as it was serialized by the last dump."""
+
+    stored_state: StoredState
+    extra_data: dict[str, Any] | None
+    fragment: json_fragment
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -139,6 +153,7 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dumped_states: dict[str, _DumpedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -218,15 +233,84 @@ class RestoreStateData:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
+            # The fragments are the JSON of the stored state dicts, which the
+            # JSON encoder writes as is
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                cast(list[dict[str, Any]], self._async_serialize_stored_states())
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    @callback
+    def _async_serialize_stored_states(self) -> list[json_fragment]:
+        """Serialize the states which should be stored.
+
+        States which did not change since the last dump reuse the JSON of
+        the last dump, including its last seen time unless that is older
+        than LAST_SEEN_REFRESH_INTERVAL. Extra data which is equal to the
+        extra data of the last dump reuses its dict instead of being
+        converted again.
+        """
+        last_dumped = self._dumped_states
+        dumped: dict[str, _DumpedState] = {}
+        serialized = 0
+        for stored_state in self.async_get_stored_states():
+            entity_id = stored_state.state.entity_id
+            previous = last_dumped.get(entity_id)
+            # States of entities which don't exist in this run
+            if previous is not None and previous.stored_state is stored_state:
+                dumped[entity_id] = previous
+                continue
+            if (extra_data_obj := stored_state.extra_data) is None:
+                extra_data = None
+                extra_data_unchanged = (
+                    previous is not None and previous.extra_data is None
+                )
+            elif (
+                previous is not None
+                and (previous_obj := previous.stored_state.extra_data) is not None
+                # An object which was mutated in place can't be compared
+                and previous_obj is not extra_data_obj
+                and previous_obj == extra_data_obj
+            ):
+                extra_data = previous.extra_data
+                extra_data_unchanged = True
+            else:
+                extra_data = extra_data_obj.as_dict()
+                extra_data_unchanged = (
+                    previous is not None
+                    and previous.extra_data == extra_data
+                    # A dict which was mutated in place can't be compared
+                    and previous.extra_data is not extra_data
+                )
+            if (
+                previous is not None
+                and extra_data_unchanged
+                and previous.stored_state.state is stored_state.state
+                and stored_state.last_seen - previous.stored_state.last_seen
+                < LAST_SEEN_REFRESH_INTERVAL
+            ):
+                dumped[entity_id] = previous
+                continue
+            try:
+                fragment = json_fragment(
+                    json_bytes(
+                        {
+                            "state": stored_state.state.json_fragment,
+                            "extra_data": extra_data,
+                            "last_seen": stored_state.last_seen,
+                        }
+                    )
+                )
+            except JSON_ENCODE_EXCEPTIONS as exc:
+                _LOGGER.error("Error serializing state of %s", entity_id, exc_info=exc)
+                continue
+            serialized += 1
+            dumped[entity_id] = _DumpedState(stored_state, extra_data, fragment)
+        self._dumped_states = dumped
+        _LOGGER.debug("Serialized %s of %s states", serialized, len(dumped))
+        return [dumped_state.fragment for dumped_state in dumped.values()]
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -6,7 +6,7 @@ import asyncio
 from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import cached_property, partial
@@ -41,6 +41,7 @@ from homeassistant.const import (
     CONF_DOMAIN,
     CONF_ELSE,
     CONF_ENABLED,
+    CONF_ENTITY_ID,
     CONF_ERROR,
     CONF_EVENT,
     CONF_EVENT_DATA,
@@ -78,6 +79,7 @@ from homeassistant.core import (
     State,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.async_ import create_eager_task
@@ -499,7 +501,7 @@ class _ScriptRun:
                 if self._stop.done():
                     return
 
-                action = cv.determine_script_action(self._action)
+                action = self._script._get_step_action(self._step)  # noqa: SLF001
 
                 if CONF_ENABLED in self._action:
                     enabled = self._action[CONF_ENABLED]
@@ -731,9 +733,22 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
+        static_params = self._script._get_static_service_params(  # noqa: SLF001
+            self._step
         )
+        if static_params is not None:
+            # The service call and its handler may update the service data and
+            # the lists and dicts in it, pass deep copies
+            params = service.ServiceParams(
+                domain=static_params["domain"],
+                service=static_params["service"],
+                service_data=deepcopy(static_params["service_data"]),
+                target=deepcopy(static_params["target"] or {}),
+            )
+        else:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -820,7 +835,7 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        cond = await self._script._async_get_condition_step(self._step)  # noqa: SLF001
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -1370,6 +1385,20 @@ def _referenced_extract_ids(data: Any, key: str, found: set[str]) -> None:
             found.add(item_id)
 
 
+def _has_dynamic_template(value: Any) -> bool:
+    """Test if a data structure has a template which is not static."""
+    if isinstance(value, template.Template):
+        return not value.is_static
+    if isinstance(value, list):
+        return any(_has_dynamic_template(val) for val in value)
+    if isinstance(value, Mapping):
+        return any(
+            _has_dynamic_template(key) or _has_dynamic_template(val)
+            for key, val in value.items()
+        )
+    return False
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -1450,6 +1479,9 @@ class Script:
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: dict[frozenset[tuple[str, str]], ConditionCheckerType] = {}
+        self._step_actions: dict[int, str] = {}
+        self._condition_steps: dict[int, ConditionCheckerType] = {}
+        self._static_service_params: dict[int, service.ServiceParams | None] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
         self._if_data: dict[int, _IfData] = {}
@@ -1826,6 +1858,40 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    def _get_step_action(self, step: int) -> str:
+        if not (action := self._step_actions.get(step)):
+            action = cv.determine_script_action(self.sequence[step])
+            self._step_actions[step] = action
+        return action
+
+    async def _async_get_condition_step(self, step: int) -> ConditionCheckerType:
+        if not (cond := self._condition_steps.get(step)):
+            cond = await self._async_get_condition(self.sequence[step])
+            self._condition_steps[step] = cond
+        return cond
+
+    def _prep_static_service_params(self, step: int) -> service.ServiceParams | None:
+        """Prepare the parameters of a service call step without dynamic templates.
+
+        Returns None if the parameters need to be rendered for every run.
+        """
+        action = self.sequence[step]
+        if _has_dynamic_template(action):
+            return None
+        # Entity registry ids are resolved to entity ids when calling the service,
+        # the entity ids they resolve to can change between runs
+        target = action.get(CONF_TARGET) or {}
+        if isinstance(entity_ids := target.get(CONF_ENTITY_ID), list) and not all(
+            valid_entity_id(entity_id) for entity_id in entity_ids
+        ):
+            return None
+        return service.async_prepare_call_from_config(self._hass, action)
+
+    def _get_static_service_params(self, step: int) -> service.ServiceParams | None:
+        if step not in self._static_service_params:
+            self._static_service_params[step] = self._prep_static_service_params(step)
+        return self._static_service_params[step]
+
     def _prep_repeat_script(self, step: int) -> Script:
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
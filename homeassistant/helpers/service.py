@@ -8,6 +8,7 @@ import dataclasses
 from enum import Enum
 from functools import cache, partial
 import logging
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
@@ -47,7 +48,6 @@ from homeassistant.exceptions import (
     UnknownUser,
 )
 from homeassistant.loader import Integration, async_get_integrations, bind_hass
-from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml import load_yaml_dict
 from homeassistant.util.yaml.loader import JSON_TYPE
@@ -59,6 +59,7 @@ from . import (
     entity_registry,
     floor_registry,
     label_registry,
+    target_index,
     template,
     translation,
 )
@@ -76,6 +77,9 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]] = (
     HassKey("service_description_cache")
 )
+ENTITY_SERVICE_STATS: HassKey[dict[str, EntityServiceStats]] = HassKey(
+    "entity_service_stats"
+)
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
@@ -262,6 +266,28 @@ class ServiceTargetSelector:
         )
 
 
+@dataclasses.dataclass(slots=True)
+class EntityServiceStats:
+    """Latency of the calls of an entity service, per entity."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return a dictionary representation of the statistics."""
+        return dataclasses.asdict(self)
+
+
+@callback
+def async_get_entity_service_stats(hass: HomeAssistant) -> dict[str, dict[str, float]]:
+    """Return the latency of the entity services per domain.service."""
+    return {
+        service: stats.as_dict()
+        for service, stats in hass.data.get(ENTITY_SERVICE_STATS, {}).items()
+    }
+
+
 @dataclasses.dataclass(slots=True)
 class SelectedEntities:
     """Class to hold the selected entities."""
@@ -526,9 +552,9 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
+    index = target_index.async_get(hass)
 
     if selector.floor_ids:
         floor_reg = floor_registry.async_get(hass)
@@ -544,77 +570,59 @@ def async_extract_referenced_entity_ids(  # noqa: C901
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
 
+    # Devices referenced by a label, their entities are only referenced
+    # if they don't have an area of their own
+    label_devices: set[str] = set()
     if selector.label_ids:
         label_reg = label_registry.async_get(hass)
         for label_id in selector.label_ids:
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
+            selected.indirectly_referenced.update(
+                index.async_label_entities(label_id, visible_only=True)
+            )
 
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
+            label_devices.update(
+                device_entry.id
+                for device_entry in dev_reg.devices.get_devices_for_label(label_id)
+            )
 
             for area_entry in area_reg.areas.get_areas_for_label(label_id):
                 selected.referenced_areas.add(area_entry.id)
 
     # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
+    for floor_id in selector.floor_ids:
+        selected.referenced_areas.update(index.async_floor_areas(floor_id))
 
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
+    selected.referenced_devices.update(label_devices)
 
     selected.referenced_areas.update(selector.area_ids)
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            selected.referenced_devices.update(
-                device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
-            )
-
-    if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
+    for area_id in selected.referenced_areas:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+        )
+        # Add indirectly referenced by area, this includes the entities
+        # of devices in the area which have no explicitly set area.
+        # Entities which are hidden or which are config or diagnostic
+        # entities are not added.
+        selected.indirectly_referenced.update(
+            index.async_area_entities(area_id, visible_only=True)
+        )
 
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
     # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
-            )
+    for device_id in selector.device_ids:
+        selected.indirectly_referenced.update(
+            index.async_device_entities(device_id, visible_only=True)
         )
-    )
+    for device_id in label_devices - selector.device_ids:
+        selected.indirectly_referenced.update(
+            index.async_device_entities(device_id, visible_only=True, without_area=True)
+        )
+
     return selected
 
 
@@ -993,23 +1001,18 @@ async def entity_service_call(
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
-        single_response = await _handle_entity_call(
-            hass, entity, func, data, call.context
+        single_response = await _handle_entity_call_and_update(
+            hass, entity, func, data, call, False
         )
-        if entity.should_poll:
-            # Context expires if the turn on commands took a long time.
-            # Set context again so it's there when we update
-            entity.async_set_context(call.context)
-            await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
-    # Use asyncio.gather here to ensure the returned results
-    # are in the same order as the entities list
+    # Each entity is updated as soon as its own service call is done, so that
+    # a slow entity doesn't hold back the state updates of the others. Use
+    # asyncio.gather here to ensure the returned results are in the same order
+    # as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
-            )
+            _handle_entity_call_and_update(hass, entity, func, data, call)
             for entity in entities
         ],
         return_exceptions=True,
@@ -1021,24 +1024,53 @@ async def entity_service_call(
             raise result from None
         response_data[entity.entity_id] = result
 
-    tasks: list[asyncio.Task[None]] = []
+    return response_data if return_response and response_data else None
 
-    for entity in entities:
-        if not entity.should_poll:
-            continue
 
+async def _handle_entity_call_and_update(
+    hass: HomeAssistant,
+    entity: Entity,
+    func: str | HassJob,
+    data: dict | ServiceCall,
+    call: ServiceCall,
+    request_call: bool = True,
+) -> ServiceResponse:
+    """Call the service method of an entity and update its state if polled.
+
+    The service call is limited by the parallel updates semaphore of the
+    entity's platform if request_call is set. The latency of the call is
+    added to the statistics of the service.
+    """
+    context = call.context
+    start = time.monotonic()
+    if request_call:
+        result = await entity.async_request_call(
+            _handle_entity_call(hass, entity, func, data, context)
+        )
+    else:
+        result = await _handle_entity_call(hass, entity, func, data, context)
+
+    duration = time.monotonic() - start
+    key = f"{call.domain}.{call.service}"
+    service_stats = hass.data.setdefault(ENTITY_SERVICE_STATS, {})
+    if (stats := service_stats.get(key)) is None:
+        stats = service_stats[key] = EntityServiceStats()
+    stats.count += 1
+    stats.total += duration
+    stats.max = max(stats.max, duration)
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Service %s for %s took %.3f seconds", func, entity.entity_id, duration
+        )
+
+    if entity.should_poll:
         # Context expires if the turn on commands took a long time.
         # Set context again so it's there when we update
-        entity.async_set_context(call.context)
-        tasks.append(create_eager_task(entity.async_update_ha_state(True)))
+        entity.async_set_context(context)
+        await entity.async_update_ha_state(True)
 
-    if tasks:
-        done, pending = await asyncio.wait(tasks)
-        assert not pending
-        for future in done:
-            future.result()  # pop exception if have
-
-    return response_data if return_response and response_data else None
+    return result
 
 
 async def _handle_entity_call(
@@ -6,13 +6,16 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
-from functools import cached_property
+from dataclasses import asdict, dataclass, field
+from functools import cached_property, partial
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import Any, cast
 
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -31,8 +34,9 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +52,12 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+type _PreloadResult = tuple[json_util.JsonValueType, float]
+
+JOURNAL_SUFFIX = ".journal"
+# Write a new snapshot once the journal grows beyond this part of the snapshot
+JOURNAL_COMPACT_RATIO = 0.25
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -102,6 +112,156 @@ def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     return hass.data[STORAGE_MANAGER]
 
 
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, dict[str, int]]:
+    """Return the write statistics of each store."""
+    return get_internal_store_manager(hass).async_get_write_stats()
+
+
+@dataclass(slots=True)
+class StoreWriteStats:
+    """Write statistics of a store."""
+
+    writes: int = 0
+    skipped: int = 0
+    bytes_written: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return a dictionary representation of the statistics."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class _JournalState:
+    """Data of a store as last written to its snapshot and journal.
+
+    Lists of objects with an id are tracked per item, other top level
+    values as a whole. Only hashes of the serialized data are kept.
+    """
+
+    generation: str
+    version: tuple[int, int]
+    snapshot_size: int
+    journal_size: int = 0
+    values: dict[str, int] = field(default_factory=dict)
+    items: dict[str, dict[Any, int]] = field(default_factory=dict)
+    item_ids: dict[str, dict[int, Any]] = field(default_factory=dict)
+
+
+def _journal_item_id(item: Any, item_bytes: bytes) -> Any:
+    """Return the id of an item of a list, or None if it has none."""
+    if not isinstance(item, Mapping):
+        item = json_util.json_loads(item_bytes)
+    if isinstance(item, Mapping):
+        return item.get("id")
+    return None
+
+
+def _journal_state_for_snapshot(
+    generation: str, data: dict, snapshot_size: int
+) -> _JournalState:
+    """Return the journal state of a snapshot which was just written."""
+    state = _JournalState(
+        generation, (data["version"], data["minor_version"]), snapshot_size
+    )
+    if not isinstance(body := data["data"], Mapping):
+        return state
+    for key, value in body.items():
+        if isinstance(value, list):
+            items: dict[Any, int] = {}
+            item_ids: dict[int, Any] = {}
+            for item in value:
+                item_bytes = json_helper.json_bytes(item)
+                if (item_id := _journal_item_id(item, item_bytes)) is None:
+                    break
+                item_hash = hash(item_bytes)
+                items[item_id] = item_hash
+                item_ids[item_hash] = item_id
+            else:
+                state.items[key] = items
+                state.item_ids[key] = item_ids
+                continue
+        state.values[key] = hash(json_helper.json_bytes(value))
+    return state
+
+
+def _journal_records(state: _JournalState, data: dict) -> list[dict] | None:
+    """Return the journal records to get from the state to data.
+
+    The state is updated to match data. Returns None if the changes
+    can't be journaled and a new snapshot must be written.
+    """
+    body = data["data"]
+    if (
+        (data["version"], data["minor_version"]) != state.version
+        or not isinstance(body, Mapping)
+        or body.keys() != state.values.keys() | state.items.keys()
+    ):
+        return None
+    records: list[dict] = []
+    for key, value in body.items():
+        if (item_ids := state.item_ids.get(key)) is None:
+            value_bytes = json_helper.json_bytes(value)
+            if (value_hash := hash(value_bytes)) != state.values[key]:
+                state.values[key] = value_hash
+                records.append(
+                    {"key": key, "value": json_helper.json_fragment(value_bytes)}
+                )
+            continue
+        if not isinstance(value, list):
+            return None
+        items = state.items[key]
+        seen: set[Any] = set()
+        for item in value:
+            item_bytes = json_helper.json_bytes(item)
+            if (item_id := item_ids.get(item_hash := hash(item_bytes))) is None:
+                if (item_id := _journal_item_id(item, item_bytes)) is None:
+                    return None
+                if (old_hash := items.get(item_id)) is not None:
+                    del item_ids[old_hash]
+                items[item_id] = item_hash
+                item_ids[item_hash] = item_id
+                records.append(
+                    {
+                        "key": key,
+                        "id": item_id,
+                        "value": json_helper.json_fragment(item_bytes),
+                    }
+                )
+            seen.add(item_id)
+        for item_id in items.keys() - seen:
+            del item_ids[items.pop(item_id)]
+            records.append({"key": key, "id": item_id})
+    return records
+
+
+def _file_signature(path: str) -> tuple[int, int, int] | None:
+    """Return the inode, size and modification time of a file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _append_file(filename: str, data: bytes, private: bool) -> None:
+    """Append data to a file and flush it to disk."""
+    try:
+        fd = os.open(
+            filename,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o600 if private else 0o644,
+        )
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as error:
+        _LOGGER.exception("Appending to file failed: %s", filename)
+        raise WriteError(error) from error
+
+
 class _StoreManager:
     """Class to help storing data.
 
@@ -114,8 +274,14 @@ class _StoreManager:
         self._invalidated: set[str] = set()
         self._files: set[str] | None = None
         self._data_preload: dict[str, json_util.JsonValueType] = {}
+        self._preloading: dict[str, asyncio.Future[_PreloadResult]] = {}
+        self._preload_timings: dict[str, float] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self._pending_writes: list[tuple[Store, str, dict]] = []
+        self._pending_futures: list[asyncio.Future[None]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._write_stats: dict[str, StoreWriteStats] = {}
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -203,22 +369,137 @@ class _StoreManager:
         self._data_preload.clear()
 
     async def async_preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
+        """Cache the keys.
+
+        Each file is read and decoded by its own executor job so the files
+        are loaded concurrently. Stores which load a key while it is being
+        preloaded wait for the preload instead of reading the file again.
+        """
         # If async_initialize has not been called yet, we can't preload
-        if self._files is not None and (existing := self._files.intersection(keys)):
-            await self._hass.async_add_executor_job(self._preload, existing)
-
-    def _preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
-        storage_path = self._storage_path
-        data_preload = self._data_preload
-        for key in keys:
-            storage_file: Path = storage_path.joinpath(key)
+        if self._files is None:
+            return
+        futures: list[asyncio.Future[_PreloadResult]] = []
+        for key in self._files.intersection(keys):
+            if (
+                key in self._invalidated
+                or key in self._data_preload
+                or key in self._preloading
+            ):
+                continue
+            future = self._hass.async_add_executor_job(self._preload, key)
+            future.add_done_callback(partial(self._async_preload_done, key))
+            self._preloading[key] = future
+            futures.append(future)
+        if futures:
+            await asyncio.wait(futures)
+
+    @callback
+    def _async_preload_done(
+        self, key: str, future: asyncio.Future[_PreloadResult]
+    ) -> None:
+        """Cache the data of a preloaded key."""
+        del self._preloading[key]
+        if future.cancelled():
+            return
+        data, duration = future.result()
+        self._preload_timings[key] = duration
+        # The store may have saved while the file was being read
+        if data is not None and key not in self._invalidated:
+            self._data_preload[key] = data
+
+    @callback
+    def async_get_preload(self, key: str) -> asyncio.Future[_PreloadResult] | None:
+        """Return the preload of a key if it is in progress."""
+        return self._preloading.get(key)
+
+    @callback
+    def async_get_preload_timings(self) -> dict[str, float]:
+        """Return the seconds it took to read and decode each preloaded file."""
+        return self._preload_timings
+
+    def _preload(self, key: str) -> _PreloadResult:
+        """Load a key to cache it."""
+        start = time.monotonic()
+        storage_file: Path = self._storage_path.joinpath(key)
+        data: json_util.JsonValueType = None
+        try:
+            if storage_file.is_file():
+                data = json_util.load_json(storage_file)
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug("Error loading %s: %s", key, ex)
+        return data, time.monotonic() - start
+
+    async def async_write(self, store: Store, path: str, data: dict) -> None:
+        """Write the data of a store.
+
+        Writes requested by stores in the same iteration of the event loop
+        are coalesced and written by a single executor job.
+        """
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        self._pending_writes.append((store, path, data))
+        self._pending_futures.append(future)
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_soon(self._async_flush)
+        await future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write the pending writes in the executor."""
+        self._flush_handle = None
+        writes = self._pending_writes
+        futures = self._pending_futures
+        self._pending_writes = []
+        self._pending_futures = []
+        job = self._hass.async_add_executor_job(self._write_batch, writes)
+        job.add_done_callback(partial(self._async_finish_flush, writes, futures))
+
+    @staticmethod
+    def _write_batch(
+        writes: list[tuple[Store, str, dict]],
+    ) -> list[int | Exception]:
+        """Write a batch of stores."""
+        results: list[int | Exception] = []
+        for store, path, data in writes:
             try:
-                if storage_file.is_file():
-                    data_preload[key] = json_util.load_json(storage_file)
-            except Exception as ex:  # noqa: BLE001
-                _LOGGER.debug("Error loading %s: %s", key, ex)
+                results.append(store._write_data(path, data))  # noqa: SLF001
+            except Exception as err:  # noqa: BLE001
+                results.append(err)
+        return results
+
+    @callback
+    def _async_finish_flush(
+        self,
+        writes: list[tuple[Store, str, dict]],
+        futures: list[asyncio.Future[None]],
+        job: asyncio.Future[list[int | Exception]],
+    ) -> None:
+        """Record the results of a flush and resolve the waiting writes."""
+        if (job_err := job.exception()) is not None:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(job_err)
+            return
+        for (store, _, _), future, result in zip(
+            writes, futures, job.result(), strict=True
+        ):
+            if isinstance(result, Exception):
+                if not future.done():
+                    future.set_exception(result)
+                continue
+            if (stats := self._write_stats.get(store.key)) is None:
+                stats = self._write_stats[store.key] = StoreWriteStats()
+            if result:
+                stats.writes += 1
+                stats.bytes_written += result
+            else:
+                stats.skipped += 1
+            if not future.done():
+                future.set_result(None)
+
+    @callback
+    def async_get_write_stats(self) -> dict[str, dict[str, int]]:
+        """Return the write statistics of each store."""
+        return {key: stats.as_dict() for key, stats in self._write_stats.items()}
 
     def _initialize_files(self) -> None:
         """Initialize the cache."""
@@ -241,8 +522,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set, changes are appended to a journal next to the
+        file which is compacted into a new snapshot once it grows too large.
+        This is only useful for large stores where a save usually changes a
+        few items of lists of objects which have an id.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -257,6 +545,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._atomic_writes = atomic_writes
         self._read_only = read_only
         self._next_write_time = 0.0
+        self._written: tuple[bytes, tuple[int, int, int]] | None = None
+        self._journal = journal
+        self._journal_state: _JournalState | None = None
+        self._journal_compact = False
         self._manager = get_internal_store_manager(hass)
 
     @cached_property
@@ -310,8 +602,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
     async def _async_load_data(self):
         """Load the data."""
+        if self._data is None and (
+            preload := self._manager.async_get_preload(self.key)
+        ):
+            # Wait for the file to be preloaded instead of reading it again
+            await asyncio.wait((preload,))
+
+        replay_journal = self._journal
         # Check if we have a pending write
         if self._data is not None:
+            replay_journal = False
             data = self._data
 
             # If we didn't generate data yet, do it now.
@@ -387,6 +687,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if replay_journal:
+            data = await self.hass.async_add_executor_job(self._replay_journal, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -517,7 +820,33 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        self._journal_compact = True
         await self._async_handle_write_data()
+        if self._journal_compact:
+            # Nothing was pending, compact the journal on disk instead
+            await self._async_compact_journal()
+
+    async def _async_compact_journal(self) -> None:
+        """Write the snapshot and journal on disk into a new snapshot."""
+        async with self._write_lock:
+            self._journal_compact = False
+            if (
+                self._read_only
+                or self._data is not None
+                or (state := self._journal_state) is None
+                or not state.journal_size
+            ):
+                return
+            try:
+                await self.hass.async_add_executor_job(self._compact_journal)
+            except HomeAssistantError as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
+
+    def _compact_journal(self) -> None:
+        """Write the data of the snapshot with the journal replayed."""
+        self._journal_state = None
+        if data := json_util.load_json_object(self.path):
+            self._write_snapshot(self.path, self._replay_journal(data))
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -541,24 +870,139 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if (state := self._journal_state) is not None and state.journal_size:
+                # Compact the journal when Home Assistant stops
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await self._manager.async_write(self, self.path, data)
+
+    def _write_data(self, path: str, data: dict) -> int:
+        """Write the data.
 
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
+        Returns the number of bytes written, which is zero when the file
+        already holds the same data.
+        """
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            return self._write_journal(path, data)
+
+        json_data, mode = json_helper.serialize_json_for_file(
+            path, data, encoder=self._encoder
+        )
+        json_bytes = (
+            json_data.encode("utf-8") if isinstance(json_data, str) else json_data
+        )
+        digest = hashlib.sha256(json_bytes).digest()
+        # Only skip the write if the file was not changed since we wrote it
+        if self._written == (digest, _file_signature(path)):
+            _LOGGER.debug("Data for %s is unchanged, skipping write", self.key)
+            return 0
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+        method = write_utf8_file_atomic if self._atomic_writes else write_utf8_file
+        method(path, json_data, self._private, mode=mode)
+        if (signature := _file_signature(path)) is not None:
+            self._written = (digest, signature)
+        return len(json_bytes)
+
+    def _write_journal(self, path: str, data: dict) -> int:
+        """Append the changes to the journal or write a new snapshot."""
+        state = self._journal_state
+        # Start over with a snapshot if writing fails
+        self._journal_state = None
+        if state is None or (records := _journal_records(state, data)) is None:
+            return self._write_snapshot(path, data)
+
+        if not records and not self._journal_compact:
+            _LOGGER.debug("Data for %s is unchanged, skipping write", self.key)
+            self._journal_state = state
+            return 0
+
+        if (
+            self._journal_compact
+            or state.journal_size > state.snapshot_size * JOURNAL_COMPACT_RATIO
+        ):
+            return self._write_snapshot(path, data)
+
+        journal_data = b"".join(
+            json_helper.json_bytes(record) + b"\n" for record in records
         )
+        if not state.journal_size:
+            journal_data = (
+                json_helper.json_bytes({"generation": state.generation})
+                + b"\n"
+                + journal_data
+            )
+        _LOGGER.debug("Appending %s records for %s", len(records), self.key)
+        _append_file(path + JOURNAL_SUFFIX, journal_data, self._private)
+        state.journal_size += len(journal_data)
+        self._journal_state = state
+        return len(journal_data)
+
+    def _write_snapshot(self, path: str, data: dict) -> int:
+        """Write a snapshot of the data and remove the journal."""
+        self._journal_compact = False
+        generation = data["journal"] = ulid_now()
+        json_data, mode = json_helper.serialize_json_for_file(
+            path, data, encoder=self._encoder
+        )
+        _LOGGER.debug("Writing snapshot for %s to %s", self.key, path)
+        method = write_utf8_file_atomic if self._atomic_writes else write_utf8_file
+        method(path, json_data, self._private, mode=mode)
+        # A journal left behind if we fail here is ignored on load
+        # because its generation does not match the snapshot
+        with suppress(FileNotFoundError):
+            os.unlink(path + JOURNAL_SUFFIX)
+        size = len(
+            json_data.encode("utf-8") if isinstance(json_data, str) else json_data
+        )
+        self._journal_state = _journal_state_for_snapshot(generation, data, size)
+        return size
+
+    def _replay_journal(self, data: dict) -> dict:
+        """Apply the journal to the data loaded from the snapshot."""
+        try:
+            with open(self.path + JOURNAL_SUFFIX, "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return data
+
+        try:
+            header = json_util.json_loads_object(lines[0]) if lines else {}
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            header = {}
+        if "journal" not in data or header.get("generation") != data["journal"]:
+            _LOGGER.debug("Ignoring stale journal of %s", self.key)
+            return data
+
+        body = data["data"]
+        collections: dict[str, dict[Any, Any]] = {}
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads_object(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # The last record may be incomplete after an unclean shutdown
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            key = cast(str, record["key"])
+            if "id" not in record:
+                body[key] = record["value"]
+                continue
+            if (items := collections.get(key)) is None:
+                items = collections[key] = {item["id"]: item for item in body[key]}
+            if "value" in record:
+                items[record["id"]] = record["value"]
+            else:
+                items.pop(record["id"], None)
+        for key, items in collections.items():
+            body[key] = list(items.values())
+        _LOGGER.debug("Replayed %s journal records of %s", len(lines) - 1, self.key)
+        return data
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -567,8 +1011,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def async_remove(self) -> None:
         """Remove all data."""
         self._manager.async_invalidate(self.key)
+        self._written = None
+        self._journal_state = None
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, self.path + JOURNAL_SUFFIX
+                )
@@ -0,0 +1,223 @@
+"""Index of the entities referenced by areas, floors, devices and labels."""
+
+from __future__ import annotations
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+)
+from .singleton import singleton
+
+DATA_TARGET_INDEX: HassKey[TargetIndex] = HassKey("target_index")
+
+
+def _is_visible(entry: er.RegistryEntry) -> bool:
+    """Return if an entity is neither hidden nor a config or diagnostic entity."""
+    return entry.entity_category is None and entry.hidden_by is None
+
+
+def _drop_results_with[_KeyT](
+    cache: dict[str, dict[_KeyT, tuple[str, ...]]], entity_ids: set[str]
+) -> None:
+    """Drop the cached results which contain any of the entities."""
+    for item_id, results in list(cache.items()):
+        if any(not entity_ids.isdisjoint(result) for result in results.values()):
+            del cache[item_id]
+
+
+class TargetIndex:
+    """Resolve areas, floors, devices and labels to the entities they reference.
+
+    Results are built from the registry indexes on first use. When a registry
+    is updated, only the results referencing the changed item are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the target index."""
+        self.hass = hass
+        self._area_entities: dict[str, dict[bool, tuple[str, ...]]] = {}
+        self._device_entities: dict[str, dict[tuple[bool, bool], tuple[str, ...]]] = {}
+        self._floor_areas: dict[str, tuple[str, ...]] = {}
+        self._label_entities: dict[str, dict[bool, tuple[str, ...]]] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Update the index when a registry is updated."""
+        bus = self.hass.bus
+        bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_updated)
+        bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated)
+        bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated)
+        bus.async_listen(fr.EVENT_FLOOR_REGISTRY_UPDATED, self._async_floor_updated)
+        bus.async_listen(lr.EVENT_LABEL_REGISTRY_UPDATED, self._async_label_updated)
+
+    @callback
+    def _async_area_updated(
+        self, event: Event[ar.EventAreaRegistryUpdatedData]
+    ) -> None:
+        """Drop the results of an updated area and of the floors it is on."""
+        area_id = event.data["area_id"]
+        self._area_entities.pop(area_id, None)
+        for floor_id, area_ids in list(self._floor_areas.items()):
+            if area_id in area_ids:
+                del self._floor_areas[floor_id]
+        if event.data["action"] != "remove" and (
+            area := ar.async_get(self.hass).async_get_area(area_id)
+        ):
+            if area.floor_id is not None:
+                self._floor_areas.pop(area.floor_id, None)
+
+    @callback
+    def _async_device_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Drop the results of an updated device and of the areas it was in."""
+        data = event.data
+        device_id = data["device_id"]
+        self._device_entities.pop(device_id, None)
+        if data["action"] != "update":
+            # The entities of an added or removed device are updated in the
+            # entity registry, which drops the results they are part of.
+            return
+        if "area_id" in data["changes"]:
+            if (old_area_id := data["changes"]["area_id"]) is not None:
+                self._area_entities.pop(old_area_id, None)
+            if (device := dr.async_get(self.hass).async_get(device_id)) and (
+                device.area_id is not None
+            ):
+                self._area_entities.pop(device.area_id, None)
+
+    @callback
+    def _async_entity_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Drop the results which referenced or now reference an entity."""
+        data = event.data
+        entity_ids = {data["entity_id"]}
+        if data["action"] == "update" and "old_entity_id" in data:
+            entity_ids.add(data["old_entity_id"])
+        if data["action"] != "create":
+            _drop_results_with(self._area_entities, entity_ids)
+            _drop_results_with(self._device_entities, entity_ids)
+            _drop_results_with(self._label_entities, entity_ids)
+        if data["action"] == "remove" or not (
+            entry := er.async_get(self.hass).async_get(data["entity_id"])
+        ):
+            return
+        if entry.area_id is not None:
+            self._area_entities.pop(entry.area_id, None)
+        if entry.device_id is not None:
+            self._device_entities.pop(entry.device_id, None)
+            if (device := dr.async_get(self.hass).async_get(entry.device_id)) and (
+                device.area_id is not None
+            ):
+                self._area_entities.pop(device.area_id, None)
+        for label_id in entry.labels:
+            self._label_entities.pop(label_id, None)
+
+    @callback
+    def _async_floor_updated(self, event: fr.EventFloorRegistryUpdated) -> None:
+        """Drop the results of an updated floor."""
+        self._floor_areas.pop(event.data["floor_id"], None)
+
+    @callback
+    def _async_label_updated(self, event: lr.EventLabelRegistryUpdated) -> None:
+        """Drop the results of an updated label."""
+        self._label_entities.pop(event.data["label_id"], None)
+
+    @callback
+    def async_area_entities(
+        self, area_id: str, *, visible_only: bool = False
+    ) -> tuple[str, ...]:
+        """Return the entities in an area.
+
+        Entities of devices in the area are included if they don't have an area
+        of their own.
+        """
+        results = self._area_entities.setdefault(area_id, {})
+        if (entity_ids := results.get(visible_only)) is not None:
+            return entity_ids
+
+        ent_reg = er.async_get(self.hass)
+        dev_reg = dr.async_get(self.hass)
+        entries = er.async_entries_for_area(ent_reg, area_id)
+        entries.extend(
+            entry
+            for device in dr.async_entries_for_area(dev_reg, area_id)
+            for entry in er.async_entries_for_device(ent_reg, device.id)
+            if entry.area_id is None
+        )
+        entity_ids = results[visible_only] = tuple(
+            entry.entity_id
+            for entry in entries
+            if not visible_only or _is_visible(entry)
+        )
+        return entity_ids
+
+    @callback
+    def async_device_entities(
+        self, device_id: str, *, visible_only: bool = False, without_area: bool = False
+    ) -> tuple[str, ...]:
+        """Return the entities of a device.
+
+        If without_area is set, entities which have an area of their own are
+        left out.
+        """
+        key = (visible_only, without_area)
+        results = self._device_entities.setdefault(device_id, {})
+        if (entity_ids := results.get(key)) is not None:
+            return entity_ids
+
+        ent_reg = er.async_get(self.hass)
+        entity_ids = results[key] = tuple(
+            entry.entity_id
+            for entry in er.async_entries_for_device(ent_reg, device_id)
+            if (not visible_only or _is_visible(entry))
+            and (not without_area or entry.area_id is None)
+        )
+        return entity_ids
+
+    @callback
+    def async_floor_areas(self, floor_id: str) -> tuple[str, ...]:
+        """Return the areas on a floor."""
+        if (area_ids := self._floor_areas.get(floor_id)) is not None:
+            return area_ids
+
+        area_reg = ar.async_get(self.hass)
+        area_ids = self._floor_areas[floor_id] = tuple(
+            entry.id
+            for entry in ar.async_entries_for_floor(area_reg, floor_id)
+            if entry.id
+        )
+        return area_ids
+
+    @callback
+    def async_label_entities(
+        self, label_id: str, *, visible_only: bool = False
+    ) -> tuple[str, ...]:
+        """Return the entities with a label."""
+        results = self._label_entities.setdefault(label_id, {})
+        if (entity_ids := results.get(visible_only)) is not None:
+            return entity_ids
+
+        ent_reg = er.async_get(self.hass)
+        entity_ids = results[visible_only] = tuple(
+            entry.entity_id
+            for entry in er.async_entries_for_label(ent_reg, label_id)
+            if not visible_only or _is_visible(entry)
+        )
+        return entity_ids
+
+
+@callback
+@singleton(DATA_TARGET_INDEX)
+def async_get(hass: HomeAssistant) -> TargetIndex:
+    """Get the target index."""
+    index = TargetIndex(hass)
+    index.async_setup()
+    return index
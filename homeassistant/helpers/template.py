@@ -79,6 +79,7 @@ from . import (
     issue_registry,
     label_registry,
     location as loc_helper,
+    target_index,
 )
 from .singleton import singleton
 from .translation import async_translate_state
@@ -748,7 +749,8 @@ class Template:
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too, unless value_json is
+        already passed in variables.
 
         This method must be run in the event loop.
         """
@@ -762,10 +764,11 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if "value_json" not in variables:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
             render_result = _render_with_context(
@@ -1470,9 +1473,7 @@ def floor_areas(hass: HomeAssistant, floor_id_or_name: str) -> Iterable[str]:
     if _floor_id is None:
         return []
 
-    area_reg = area_registry.async_get(hass)
-    entries = area_registry.async_entries_for_floor(area_reg, _floor_id)
-    return [entry.id for entry in entries if entry.id]
+    return list(target_index.async_get(hass).async_floor_areas(_floor_id))
 
 
 def areas(hass: HomeAssistant) -> Iterable[str | None]:
@@ -1564,23 +1565,9 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         _area_id = area_id_or_name
     if _area_id is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
-        entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
-    ]
-    dev_reg = device_registry.async_get(hass)
-    # We also need to add entities tied to a device in the area that don't themselves
-    # have an area specified since they inherit the area from the device.
-    entity_ids.extend(
-        [
-            entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
-        ]
-    )
-    return entity_ids
+    # Entities tied to a device in the area that don't themselves have an area
+    # specified are included since they inherit the area from the device.
+    return list(target_index.async_get(hass).async_area_entities(_area_id))
 
 
 def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
@@ -1680,9 +1667,7 @@ def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     """Return entities for a given label ID or name."""
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entries = entity_registry.async_entries_for_label(ent_reg, _label_id)
-    return [entry.entity_id for entry in entries]
+    return list(target_index.async_get(hass).async_label_entities(_label_id))
 
 
 def closest(hass, *args):
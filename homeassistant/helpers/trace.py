@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections import deque
 from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from functools import wraps
 from typing import Any
 
@@ -40,6 +40,7 @@ class TraceElement:
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
 
+        self._variables: dict[str, Any] | None = None
         self._last_variables = variables_cv.get() or {}
         self.update_variables(variables)
 
@@ -67,6 +68,8 @@ class TraceElement:
 
     def update_variables(self, variables: TemplateVarsType) -> None:
         """Update variables."""
+        if not trace_enabled_cv.get():
+            return
         if variables is None:
             variables = {}
         last_variables = self._last_variables
@@ -112,6 +115,8 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# Whether trace elements are recorded
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -132,6 +137,21 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+def trace_enabled_set(enabled: bool) -> Token[bool]:
+    """Enable or disable recording trace elements for the current run."""
+    return trace_enabled_cv.set(enabled)
+
+
+def trace_enabled_reset(token: Token[bool]) -> None:
+    """Restore if trace elements are recorded to the state before the run."""
+    trace_enabled_cv.reset(token)
+
+
+def trace_enabled_get() -> bool:
+    """Return if trace elements are recorded for the current run."""
+    return trace_enabled_cv.get()
+
+
 def trace_stack_push[_T](
     trace_stack_var: ContextVar[list[_T] | None], node: _T
 ) -> None:
@@ -183,6 +203,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled_cv.get():
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Mapping
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
-from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol
 import urllib.error
@@ -27,7 +26,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity, poll_scheduler
 from .debounce import Debouncer
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -61,6 +60,20 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting ``max_update_interval`` enables adaptive polling: each scheduled
+    refresh which returns unchanged data doubles the interval until it reaches
+    ``max_update_interval``. Changed data or a refresh which was not scheduled,
+    like one requested after a service call, brings it back to
+    ``update_interval``. This also requires that the data implements ``__eq__``.
+
+    Setting :attr:`only_update_changed_contexts` to ``True`` will cause the
+    coordinator to only callback listeners whose context is a key of the data
+    mapping whose value has changed. Listeners without a context are called
+    back when any value has changed, and all listeners are called back when
+    availability changes or the data is not a mapping.
+    Subclasses can override :meth:`_async_get_changed_contexts` to compute the
+    changed contexts for other types of data.
     """
 
     def __init__(
@@ -74,6 +87,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        max_update_interval: timedelta | None = None,
+        only_update_changed_contexts: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -82,10 +97,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.update_method = update_method
         self.setup_method = setup_method
         self._update_interval_seconds: float | None = None
+        self._current_update_interval_seconds: float | None = None
         self.update_interval = update_interval
+        self._max_update_interval_seconds = (
+            max_update_interval.total_seconds() if max_update_interval else None
+        )
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.only_update_changed_contexts = only_update_changed_contexts
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -94,10 +114,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
+        # The poll scheduler staggers the refreshes based on this name
+        # to avoid a thundering herd and uses it to label the statistics.
+        self._poller_name = (
+            f"{name} - {self.config_entry.entry_id}" if self.config_entry else name
         )
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
@@ -167,10 +187,47 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         for update_callback, _ in list(self._listeners.values()):
             update_callback()
 
+    @callback
+    def _async_update_context_listeners(self, contexts: set[Any]) -> None:
+        """Update the listeners without a context or with a changed context."""
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in contexts:
+                update_callback()
+
+    @callback
+    def _async_get_changed_contexts(self, previous_data: _DataT) -> set[Any] | None:
+        """Return the contexts whose data changed, or None to update all listeners.
+
+        To be overridden by subclasses with data that isn't a mapping.
+        """
+        if (
+            not self.only_update_changed_contexts
+            or not isinstance(previous_data, Mapping)
+            or not isinstance(self.data, Mapping)
+        ):
+            return None
+        data: Mapping[Any, Any] = self.data
+        changed = {
+            key
+            for key, value in data.items()
+            if key not in previous_data or previous_data[key] != value
+        }
+        changed.update(key for key in previous_data if key not in data)
+        return changed
+
+    @callback
+    def _async_update_changed_listeners(self, previous_data: _DataT) -> None:
+        """Update the listeners affected by the data change."""
+        if (contexts := self._async_get_changed_contexts(previous_data)) is None:
+            self.async_update_listeners()
+        elif contexts:
+            self._async_update_context_listeners(contexts)
+
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
         self._async_unsub_refresh()
+        poll_scheduler.async_get(self.hass).async_remove_poller(id(self))
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
 
@@ -178,6 +235,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     def _unschedule_refresh(self) -> None:
         """Unschedule any pending refresh since there is no longer any listeners."""
         self._async_unsub_refresh()
+        poll_scheduler.async_get(self.hass).async_remove_poller(id(self))
         self._debounced_refresh.async_cancel()
 
     def async_contexts(self) -> Generator[Any]:
@@ -208,11 +266,39 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Set interval between updates."""
         self._update_interval = value
         self._update_interval_seconds = value.total_seconds() if value else None
+        self._current_update_interval_seconds = self._update_interval_seconds
+
+    @property
+    def current_update_interval(self) -> timedelta | None:
+        """Interval until the next scheduled update.
+
+        Differs from update_interval when adaptive polling backed off.
+        """
+        if self._current_update_interval_seconds is None:
+            return None
+        return timedelta(seconds=self._current_update_interval_seconds)
+
+    @callback
+    def _async_adapt_update_interval(self, idle: bool) -> None:
+        """Back off the update interval when idle, otherwise reset it."""
+        if (
+            self._update_interval_seconds is None
+            or self._current_update_interval_seconds is None
+            or self._max_update_interval_seconds is None
+        ):
+            return
+        if idle:
+            self._current_update_interval_seconds = min(
+                self._current_update_interval_seconds * 2,
+                self._max_update_interval_seconds,
+            )
+        else:
+            self._current_update_interval_seconds = self._update_interval_seconds
 
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self._update_interval_seconds is None:
+        if self._current_update_interval_seconds is None:
             return
 
         if self.config_entry and self.config_entry.pref_disable_polling:
@@ -222,18 +308,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
-        # We use loop.call_at because DataUpdateCoordinator does
+        # We use the poll scheduler because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
-        hass = self.hass
-        loop = hass.loop
-
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        self._unsub_refresh = poll_scheduler.async_get(self.hass).async_schedule(
+            id(self),
+            self._poller_name,
+            self._current_update_interval_seconds,
+            self.__wrap_handle_refresh_interval,
+            self.config_entry.entry_id if self.config_entry else None,
         )
-        self._unsub_refresh = loop.call_at(
-            next_refresh, self.__wrap_handle_refresh_interval
-        ).cancel
 
     @callback
     def __wrap_handle_refresh_interval(self) -> None:
@@ -255,7 +339,19 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        loop = self.hass.loop
+        start = loop.time()
+        try:
+            await self._async_refresh(log_failures=True, scheduled=True)
+        finally:
+            duration = loop.time() - start
+            scheduler = poll_scheduler.async_get(self.hass)
+            scheduler.async_record_run(id(self), duration)
+            if (
+                self._update_interval_seconds is not None
+                and duration > self._update_interval_seconds
+            ):
+                scheduler.async_record_overrun(id(self))
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -347,6 +443,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             start = monotonic()
 
         auth_failed = False
+        idle = False
         previous_update_success = self.last_update_success
         previous_data = self.data
 
@@ -428,6 +525,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
+            elif scheduled and self._max_update_interval_seconds is not None:
+                idle = previous_data == self.data
 
         finally:
             if log_timing:
@@ -437,6 +536,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                     monotonic() - start,  # pylint: disable=possibly-used-before-assignment
                     self.last_update_success,
                 )
+            self._async_adapt_update_interval(idle)
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
 
@@ -446,6 +546,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             return
 
         if (
+            self.only_update_changed_contexts
+            and self.last_update_success == previous_update_success
+        ):
+            self._async_update_changed_listeners(previous_data)
+        elif (
             self.always_update
             or self.last_update_success != previous_update_success
             or previous_data != self.data
@@ -476,6 +581,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
+        previous_data = self.data
+        previous_update_success = self.last_update_success
         self.data = data
         self.last_update_success = True
         self.logger.debug(
@@ -486,7 +593,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._listeners:
             self._schedule_refresh()
 
-        self.async_update_listeners()
+        if self.only_update_changed_contexts and previous_update_success:
+            self._async_update_changed_listeners(previous_data)
+        else:
+            self.async_update_listeners()
 
 
 class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
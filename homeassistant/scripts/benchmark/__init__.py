@@ -8,15 +8,18 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.script import Script
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +311,196 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_memory(hass):
+    """Measure the memory used per state and per state changed event.
+
+    Sets 9000 states and then changes each one while keeping the events
+    alive, like the recorder does while a commit is pending.
+    """
+    entities = 9000
+    attributes = {
+        "friendly_name": "Benchmark sensor",
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+    }
+    events = []
+
+    @core.callback
+    def listener(event):
+        """Keep the event."""
+        events.append(event)
+
+    tracemalloc.start()
+    start = timer()
+
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(entities):
+        hass.states.async_set(f"sensor.benchmark_{i}", "0", attributes)
+    states_size = tracemalloc.get_traced_memory()[0] - before
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(entities):
+        hass.states.async_set(f"sensor.benchmark_{i}", "1", attributes)
+    events_size = tracemalloc.get_traced_memory()[0] - before
+
+    runtime = timer() - start
+    tracemalloc.stop()
+    assert len(events) == entities
+
+    print(f"Bytes per state: {states_size // entities}")
+    print(f"Bytes per state changed event: {events_size // entities}")
+    return runtime
+
+
+@benchmark
+async def mqtt_subscription_matching(hass):
+    """Match MQTT topics against the subscriptions of a large install.
+
+    Uses 15000 topics with a simple subscription and 500 wildcard
+    subscriptions, one third of the topics has no subscription.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    devices = 15000
+    wildcards = 500
+    job = core.HassJob(lambda msg: None)
+    simple_subscriptions = {
+        f"zigbee2mqtt/device_{i}": {Subscription(f"zigbee2mqtt/device_{i}", True, job)}
+        for i in range(devices)
+    }
+    wildcard_subscriptions = SubscriptionTrie()
+    wildcard_subscriptions.add(Subscription("homeassistant/#", False, job))
+    for i in range(wildcards - 1):
+        wildcard_subscriptions.add(Subscription(f"tele/tasmota_{i}/+", False, job))
+    topics = [
+        *(f"zigbee2mqtt/device_{i}" for i in range(devices)),
+        *(f"tele/tasmota_{i % wildcards}/SENSOR" for i in range(devices)),
+        *(f"stat/unknown_{i}/POWER" for i in range(devices)),
+    ]
+
+    start = timer()
+    for _ in range(10):
+        for topic in topics:
+            subscriptions = wildcard_subscriptions.matches(topic)
+            if topic in simple_subscriptions:
+                subscriptions.extend(simple_subscriptions[topic])
+    runtime = timer() - start
+
+    print(f"Matches per second: {10 * len(topics) / runtime:.0f}")
+    return runtime
+
+
+@benchmark
+async def bluetooth_matching(hass):
+    """Match advertisements against the matchers of all integrations.
+
+    Uses advertisements of 1000 devices, most of them are not matched by
+    any integration as on a busy install.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from habluetooth import BluetoothServiceInfoBleak
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.bluetooth.match import BluetoothMatcherIndex
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.bluetooth import BLUETOOTH
+
+    index = BluetoothMatcherIndex()
+    for matcher in BLUETOOTH:
+        index.add(matcher)
+    index.build()
+
+    advertisements = [
+        # Phones and laptops
+        {"manufacturer_data": {76: b"\x10\x05\x01\x18"}},
+        {"manufacturer_data": {6: b"\x01\x09\x20\x02"}},
+        {"service_uuids": ["0000fe9f-0000-1000-8000-00805f9b34fb"]},
+        {"name": "Unknown device"},
+        # A thermometer which is matched by an integration
+        {
+            "name": "GVH5075_1234",
+            "manufacturer_data": {60552: b"\x00\x03\x1b\x2a\x64\x00"},
+        },
+    ]
+    service_infos = []
+    for i in range(1000):
+        advertisement = advertisements[i % len(advertisements)]
+        service_info = BluetoothServiceInfoBleak(
+            name=advertisement.get("name", ""),
+            address=f"AA:BB:CC:DD:{i // 256:02X}:{i % 256:02X}",
+            rssi=-60,
+            manufacturer_data=advertisement.get("manufacturer_data", {}),
+            service_data={},
+            service_uuids=advertisement.get("service_uuids", []),
+            source="local",
+            device=None,
+            advertisement=None,
+            connectable=True,
+            time=0,
+            tx_power=None,
+        )
+        service_infos.append(service_info)
+
+    start = timer()
+    for _ in range(100):
+        for service_info in service_infos:
+            index.match(service_info)
+    runtime = timer() - start
+
+    print(f"Matches per second: {100 * len(service_infos) / runtime:.0f}")
+    return runtime
+
+
+@benchmark
+async def script_runs(hass):
+    """Run a representative automation action sequence 10k times."""
+    runs = 10**4
+    calls = 0
+
+    @core.callback
+    def service_handler(call):
+        """Handle service call."""
+        nonlocal calls
+        calls += 1
+
+    hass.services.async_register("benchmark", "turn_on", service_handler)
+    hass.states.async_set("input_boolean.guest_mode", "off")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "condition": "state",
+                "entity_id": "input_boolean.guest_mode",
+                "state": "off",
+            },
+            {
+                "action": "benchmark.turn_on",
+                "target": {"area_id": "living_room"},
+                "data": {"brightness": 255, "transition": 2},
+            },
+            {
+                "action": "benchmark.turn_on",
+                "target": {"area_id": "{{ area }}"},
+                "data": {"brightness": "{{ brightness }}"},
+            },
+            {"event": "benchmark_event", "event_data": {"source": "{{ source }}"}},
+        ]
+    )
+    script = Script(hass, sequence, "benchmark", "benchmark")
+    variables = {"area": "kitchen", "brightness": 128, "source": "benchmark"}
+
+    start = timer()
+
+    for _ in range(runs):
+        await script.async_run(variables, core.Context())
+
+    assert calls == 2 * runs
+
+    return timer() - start
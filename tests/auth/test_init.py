@@ -16,6 +16,7 @@ from homeassistant.auth import (
     InvalidAuthError,
     auth_store,
     const as auth_const,
+    jwt_wrapper,
     models as auth_models,
 )
 from homeassistant.auth.const import GROUP_ID_ADMIN, MFA_SESSION_EXPIRATION
@@ -590,6 +591,34 @@ async def test_remove_refresh_token(hass: HomeAssistant) -> None:
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_access_token_cache(hass: HomeAssistant) -> None:
+    """Test verified access tokens are cached until the refresh token is removed."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        assert manager.async_validate_access_token(access_token) is refresh_token
+    assert mock_verify.call_count == 1
+    stats = manager.async_get_access_token_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["verification_time"] > 0
+
+    await manager.async_deactivate_user(user)
+    assert manager.async_validate_access_token(access_token) is None
+    await manager.async_activate_user(user)
+    assert manager.async_validate_access_token(access_token) is refresh_token
+
+    manager.async_remove_refresh_token(refresh_token)
+    assert manager.async_validate_access_token(access_token) is None
+
+
 async def test_remove_expired_refresh_token(hass: HomeAssistant) -> None:
     """Test that expired refresh tokens are deleted."""
     manager = await auth.auth_manager_from_config(hass, [], [])
@@ -132,6 +132,7 @@ async def test_diagnostics(
                     }
                 }
             },
+            "advertisements": ANY,
             "manager": {
                 "adapters": {
                     "hci0": {
@@ -290,6 +291,7 @@ async def test_diagnostics_macos(
                     "vendor_id": "Unknown",
                 }
             },
+            "advertisements": ANY,
             "manager": {
                 "adapters": {
                     "Core Bluetooth": {
@@ -483,6 +485,7 @@ async def test_diagnostics_remote_adapter(
                 }
             },
             "dbus": {},
+            "advertisements": ANY,
             "manager": {
                 "adapters": {
                     "hci0": {
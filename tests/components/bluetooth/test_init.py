@@ -18,6 +18,7 @@ from homeassistant.components.bluetooth import (
     BluetoothChange,
     BluetoothScanningMode,
     BluetoothServiceInfo,
+    BluetoothServiceInfoBleak,
     async_process_advertisements,
     async_rediscover_address,
     async_track_unavailable,
@@ -34,9 +35,11 @@ from homeassistant.components.bluetooth.match import (
     ADDRESS,
     CONNECTABLE,
     LOCAL_NAME,
+    MANUFACTURER_DATA_START,
     MANUFACTURER_ID,
     SERVICE_DATA_UUID,
     SERVICE_UUID,
+    BluetoothMatcherIndex,
 )
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
@@ -3240,3 +3243,48 @@ async def test_title_updated_if_mac_address(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
     assert entry.title == "ACME Bluetooth Adapter 5.0 (00:00:00:00:00:01)"
+
+
+def test_matcher_index_caches_matches() -> None:
+    """Test matches are cached by the matchable fields of an advertisement."""
+    index = BluetoothMatcherIndex()
+    matcher = {"domain": "test", MANUFACTURER_ID: 76, MANUFACTURER_DATA_START: [2]}
+    index.add(matcher)
+    index.build()
+
+    def _service_info(
+        manufacturer_data: bytes, name: str = "beacon", manufacturer_id: int = 76
+    ) -> BluetoothServiceInfoBleak:
+        return BluetoothServiceInfoBleak(
+            name=name,
+            address="44:44:33:11:23:45",
+            rssi=-60,
+            manufacturer_data={manufacturer_id: manufacturer_data},
+            service_data={},
+            service_uuids=[],
+            source="local",
+            device=generate_ble_device("44:44:33:11:23:45", "beacon"),
+            advertisement=generate_advertisement_data(),
+            connectable=True,
+            time=time.monotonic(),
+            tx_power=0,
+        )
+
+    with patch(
+        "homeassistant.components.bluetooth.match.ble_device_matches",
+        wraps=bluetooth.match.ble_device_matches,
+    ) as mock_ble_device_matches:
+        assert index.match(_service_info(b"\x02\x15")) == [matcher]
+        assert index.match(_service_info(b"\x02\x16")) == [matcher]
+        assert index.match(_service_info(b"\x03\x15")) == []
+        # The name is not part of the fingerprint without local name matchers
+        assert index.match(_service_info(b"\x02\x15", "other")) == [matcher]
+        # Service infos which can't match any bucket are rejected before caching
+        assert index.match(_service_info(b"\x02\x15", manufacturer_id=6)) == []
+    # Only the start of the manufacturer data is part of the fingerprint
+    assert len(mock_ble_device_matches.mock_calls) == 2
+    assert len(index._match_cache) == 2
+
+    index.remove(matcher)
+    index.build()
+    assert index.match(_service_info(b"\x02\x15")) == []
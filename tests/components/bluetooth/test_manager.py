@@ -1268,3 +1268,48 @@ async def test_set_fallback_interval_big(hass: HomeAssistant) -> None:
 
     # We should forget fallback interval after it expires
     assert async_get_fallback_availability_interval(hass, "44:44:33:11:23:12") is None
+
+
+@pytest.mark.usefixtures("enable_bluetooth")
+async def test_advertisement_rate_limit(
+    hass: HomeAssistant, register_hci0_scanner: None
+) -> None:
+    """Test the advertisements of an address can be rate limited."""
+    address = "44:44:33:11:23:45"
+    device = generate_ble_device(address, "wohand")
+    manufacturer_data: list[bytes] = []
+
+    @callback
+    def _callback(
+        service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        manufacturer_data.append(service_info.manufacturer_data[1])
+
+    cancel = bluetooth.async_register_callback(
+        hass, _callback, {"address": address}, BluetoothScanningMode.ACTIVE
+    )
+    bluetooth.async_set_advertisement_rate_limit(hass, address, 5.0)
+    for payload in (b"\x01", b"\x02", b"\x02", b"\x03"):
+        adv = generate_advertisement_data(
+            local_name="wohand", manufacturer_data={1: payload}
+        )
+        inject_advertisement_with_source(hass, device, adv, "hci0")
+    assert manufacturer_data == [b"\x01"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert manufacturer_data == [b"\x01", b"\x03"]
+
+    # Identical advertisements are dropped before they reach the rate limit
+    assert _get_manager().async_get_advertisement_stats()["hci0"] == {
+        "received": 4,
+        "deduplicated": 1,
+        "throttled": 2,
+        "dispatched": 2,
+    }
+
+    bluetooth.async_set_advertisement_rate_limit(hass, address, None)
+    adv = generate_advertisement_data(local_name="wohand", manufacturer_data={1: b"4"})
+    inject_advertisement_with_source(hass, device, adv, "hci0")
+    assert manufacturer_data == [b"\x01", b"\x03", b"4"]
+    cancel()
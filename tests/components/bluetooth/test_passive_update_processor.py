@@ -394,6 +394,71 @@ async def test_entity_key_is_dispatched_on_entity_key_change(
     cancel_coordinator()
 
 
+@pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
+async def test_min_update_interval(hass: HomeAssistant) -> None:
+    """Test changes within the min update interval are held back and merged."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    updates = [
+        GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE,
+        GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE_WITH_TEMP_CHANGE,
+        GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE,
+    ]
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfo,
+    ) -> dict[str, str]:
+        return {"test": "data"}
+
+    @callback
+    def _async_generate_mock_data(
+        data: dict[str, str],
+    ) -> PassiveBluetoothDataUpdate:
+        """Generate mock data."""
+        return updates.pop(0)
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+    )
+    processor = PassiveBluetoothDataProcessor(
+        _async_generate_mock_data, min_update_interval=5
+    )
+    unregister_processor = coordinator.async_register_processor(processor)
+    cancel_coordinator = coordinator.async_start()
+
+    entity_key = PassiveBluetoothEntityKey("temperature", None)
+    entity_key_events: list[PassiveBluetoothDataUpdate | None] = []
+    all_events: list[PassiveBluetoothDataUpdate | None] = []
+    processor.async_add_entity_key_listener(entity_key_events.append, entity_key)
+    processor.async_add_listener(all_events.append)
+
+    # The first update makes the device available so it is dispatched right away
+    inject_bluetooth_service_info(hass, GENERIC_BLUETOOTH_SERVICE_INFO)
+    assert len(entity_key_events) == 1
+    assert len(all_events) == 1
+
+    inject_bluetooth_service_info(hass, GENERIC_BLUETOOTH_SERVICE_INFO_2)
+    inject_bluetooth_service_info(hass, GENERIC_BLUETOOTH_SERVICE_INFO)
+    assert len(entity_key_events) == 1
+    assert len(all_events) == 1
+    assert processor.entity_data[entity_key] == 14.5
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    # The held back changes are dispatched together with the accumulated data
+    assert len(entity_key_events) == 2
+    assert entity_key_events[1] is processor.data
+    assert len(all_events) == 2
+    assert coordinator.available is True
+
+    unregister_processor()
+    cancel_coordinator()
+
+
 @pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
 async def test_unavailable_after_no_data(hass: HomeAssistant) -> None:
     """Test that the coordinator is unavailable after no data for a while."""
@@ -1,5 +1,7 @@
 """The tests for http static files."""
 
+from datetime import UTC, datetime
+import gzip
 from http import HTTPStatus
 from pathlib import Path
 
@@ -7,7 +9,14 @@ from aiohttp.test_utils import TestClient
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import (
+    HOT_CACHE,
+    CachingStaticResource,
+    _accepted_encodings,
+    _HotCache,
+    _HotFile,
+    _HotFileVariant,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +72,113 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_hot_cache(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test small files are served from memory with precompressed variants."""
+    app = hass.http.app
+    path = tmp_path / "app.js"
+    path.write_text("console.log('hello');")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('gzip');"))
+
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    # The first request resolves the file, the following ones are served from memory
+    for _ in range(2):
+        resp = await mock_http_client.get(
+            "/static/app.js", headers={"Accept-Encoding": "identity"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert await resp.text() == "console.log('hello');"
+        assert "Content-Encoding" not in resp.headers
+    assert path.resolve() in HOT_CACHE
+
+    # Changes on disk are only picked up once the file expires from memory
+    path.write_text("console.log('world');")
+    resp = await mock_http_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert await resp.text() == "console.log('hello');"
+
+    resp = await mock_http_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["Cache-Control"] == "public, max-age=2678400"
+    assert await resp.text() == "console.log('gzip');"
+
+    resp = await mock_http_client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": resp.headers["ETag"]},
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    resp = await mock_http_client.get(
+        "/static/app.js",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-Modified-Since": resp.headers["Last-Modified"],
+        },
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    # Brotli is preferred over gzip
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    HOT_CACHE.clear()
+    resp = await mock_http_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip, br"}, auto_decompress=False
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "br"
+    assert await resp.read() == b"brotli"
+
+    # Encodings the client refuses are not served
+    resp = await mock_http_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "br;q=0, gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.text() == "console.log('gzip');"
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "encodings"),
+    [
+        ("", []),
+        ("identity", []),
+        ("gzip, deflate, br", ["br", "gzip"]),
+        ("br;q=0, gzip", ["gzip"]),
+        ("GZIP;Q=0.5, br;q=0.2", ["gzip", "br"]),
+        ("gzip;q=0.5, *;q=0.8", ["br", "gzip"]),
+        ("*;q=0", []),
+        ("br;q=invalid, gzip", ["gzip"]),
+        ("brotli, xgzip", []),
+    ],
+)
+def test_accepted_encodings(accept_encoding: str, encodings: list[str]) -> None:
+    """Test parsing the encodings accepted by a client."""
+    assert [
+        encoding for encoding, _ in _accepted_encodings(accept_encoding)
+    ] == encodings
+
+
+async def test_hot_cache_size(tmp_path: Path) -> None:
+    """Test the least recently used files are dropped when the cache is full."""
+    cache = _HotCache(10)
+    variant = _HotFileVariant(b"12345", "etag", datetime.now(UTC))
+    files = {name: _HotFile(0) for name in ("a", "b", "c")}
+    for name, hot_file in files.items():
+        cache.set(tmp_path / name, hot_file)
+        cache.set_variant(tmp_path / name, hot_file, "", variant)
+        assert cache.get(tmp_path / "a") is files["a"]
+
+    assert tmp_path / "a" in cache
+    assert tmp_path / "b" not in cache
+    assert tmp_path / "c" in cache
+    assert cache.size == 10
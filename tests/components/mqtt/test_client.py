@@ -12,9 +12,18 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    PUBLISH_THROUGHPUT_WINDOW,
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
-from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
+from homeassistant.components.mqtt.models import (
+    MessageCallbackType,
+    ReceiveMessage,
+    cached_json_loads,
+)
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
     CONF_PROTOCOL,
@@ -22,7 +31,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -283,6 +298,29 @@ async def test_subscribe_topic(
         unsub()
 
 
+async def test_subscribers_share_decoded_payload(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the payload is decoded once for all subscribers of a message."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test-topic", '{"hello": "world"}')
+    await hass.async_block_till_done()
+
+    assert len(recorded_calls) == 3
+    payloads = [msg.payload for msg in recorded_calls]
+    decoded = [payload for payload in payloads if isinstance(payload, str)]
+    assert len(decoded) == 2
+    assert decoded[0] is decoded[1]
+    assert cached_json_loads(decoded[0]) is cached_json_loads(decoded[1])
+
+
 @pytest.mark.usefixtures("mqtt_mock_entry")
 async def test_subscribe_topic_not_initialize(
     hass: HomeAssistant, record_calls: MessageCallbackType
@@ -1229,6 +1267,32 @@ async def test_handle_mqtt_on_callback_after_timeout(
     assert "InvalidStateError" not in caplog.text
 
 
+async def test_publish_stats(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test QoS 0 messages are not waited for and publishes are counted."""
+    mqtt_mock = await mqtt_mock_entry()
+    await hass.async_block_till_done()
+    published = mqtt_mock().async_get_publish_stats()["qos_0"]["published"]
+
+    await mqtt.async_publish(hass, "test-topic", "test-payload", 0)
+    assert mqtt_mock().async_get_publish_stats()["qos_0"]["pending"] == 1
+
+    await mqtt.async_publish(hass, "test-topic", "test-payload", 1)
+    await hass.async_block_till_done()
+    stats = mqtt_mock().async_get_publish_stats()
+    assert stats["qos_0"]["pending"] == 0
+    assert stats["qos_0"]["published"] == published + 1
+    assert stats["qos_1"]["pending"] == 0
+    assert stats["qos_1"]["published"] == 1
+    assert stats["qos_1"]["timeouts"] == 0
+    assert stats["qos_1"]["latency_max"] >= stats["qos_1"]["latency_avg"] >= 0
+    assert stats["qos_1"]["throughput"] == 1 / PUBLISH_THROUGHPUT_WINDOW
+    assert stats["qos_2"]["published"] == 0
+    assert not mqtt_mock()._pending_operations
+
+
 async def test_publish_error(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1384,7 +1448,7 @@ async def test_handle_mqtt_timeout_on_callback(
         assert await hass.config_entries.async_setup(entry.entry_id)
 
         # Now call we publish without simulating and ACK callback
-        await mqtt.async_publish(hass, "no_callback/test-topic", "test-payload")
+        await mqtt.async_publish(hass, "no_callback/test-topic", "test-payload", 1)
         await hass.async_block_till_done()
         # There is no ACK so we should see a timeout in the log after publishing
         assert len(mock_client.publish.mock_calls) == 1
@@ -1997,3 +2061,38 @@ async def test_loop_write_failure(
     await hass.async_block_till_done()
 
     assert "Disconnected from MQTT server test-broker:1883" in caplog.text
+
+
+def test_subscription_trie() -> None:
+    """Test matching topics against wildcard subscriptions."""
+    job = HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic: Subscription(topic, False, job)
+        for topic in ("a/+/c", "a/#", "#", "+/b/c", "$SYS/#", "+/+")
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    def matching(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.matches(topic)}
+
+    assert matching("a/b/c") == {"a/+/c", "a/#", "#", "+/b/c"}
+    assert matching("a") == {"a/#", "#"}
+    assert matching("x/y") == {"#", "+/+"}
+    # Wildcards on the first level don't match topics starting with $
+    assert matching("$SYS/broker") == {"$SYS/#"}
+    assert trie.has_topic("a/#")
+    assert not trie.has_topic("a/b")
+    assert set(trie) == set(subscriptions.values())
+
+    trie.remove(subscriptions["a/#"])
+    assert matching("a/b/c") == {"a/+/c", "#", "+/b/c"}
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["a/#"])
+
+    for topic, subscription in subscriptions.items():
+        if topic != "a/#":
+            trie.remove(subscription)
+    assert not list(trie)
+    assert not trie._root.children
@@ -40,6 +40,7 @@ async def test_entry_diagnostics(
         "devices": [],
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
+        "publish_stats": ANY,
     }
 
     # Discover a device with an entity and a trigger
@@ -125,6 +126,7 @@ async def test_entry_diagnostics(
         "devices": [expected_device],
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
+        "publish_stats": ANY,
     }
 
     assert await get_diagnostics_for_device(
@@ -254,6 +256,7 @@ async def test_redact_diagnostics(
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
+        "publish_stats": ANY,
     }
 
     assert await get_diagnostics_for_device(
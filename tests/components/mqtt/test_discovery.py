@@ -24,6 +24,7 @@ from homeassistant.components.mqtt.discovery import (
     async_start,
 )
 from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_STATE_CHANGED,
@@ -218,6 +219,72 @@ async def test_correct_config_discovery(
     assert ("binary_sensor", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+async def test_discovery_burst_sets_up_platform_once(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test a burst of discovery messages sets up their platform once."""
+    await mqtt_mock_entry()
+    with patch.object(
+        ConfigEntry,
+        "async_create_task",
+        autospec=True,
+        side_effect=ConfigEntry.async_create_task,
+    ) as mock_create_task:
+        for i in range(10):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/bla{i}/config",
+                f'{{ "name": "Beer {i}", "state_topic": "test-topic" }}',
+            )
+        await hass.async_block_till_done()
+
+    setup_tasks = [
+        call
+        for call in mock_create_task.mock_calls
+        if call.args[2].__name__ == "_async_component_setup"
+    ]
+    assert len(setup_tasks) == 1
+    assert len(hass.states.async_entity_ids("binary_sensor")) == 10
+    for i in range(10):
+        assert (
+            "binary_sensor",
+            f"bla{i}",
+        ) in hass.data["mqtt"].discovery_already_discovered
+
+
+async def test_discovery_burst_adds_entities_together(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test a burst of discovery messages for a loaded platform is added together."""
+    await mqtt_mock_entry()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/first/config",
+        '{ "name": "First", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+
+    batches: list[int] = []
+
+    @callback
+    def _discovery_new(discovery_payloads: list[MQTTDiscoveryPayload]) -> None:
+        batches.append(len(discovery_payloads))
+
+    async_dispatcher_connect(
+        hass, MQTT_DISCOVERY_NEW.format("binary_sensor", "mqtt"), _discovery_new
+    )
+    for i in range(10):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/bla{i}/config",
+            f'{{ "name": "Beer {i}", "state_topic": "test-topic" }}',
+        )
+    await hass.async_block_till_done()
+
+    assert batches == [10]
+    assert len(hass.states.async_entity_ids("binary_sensor")) == 11
+
+
 async def test_discovery_integration_info(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1912,6 +1912,8 @@ async def test_disabling_and_enabling_entry(
             config_alarm_control_panel,
         )
         async_fire_mqtt_message(hass, "homeassistant/light/abc/config", config_light)
+        # Discovered entities are added in batches after the messages are handled
+        await hass.async_block_till_done()
 
     # Disable MQTT config entry
     await hass.config_entries.async_set_disabled_by(
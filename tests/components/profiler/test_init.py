@@ -34,9 +34,11 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import discovery_flow
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +448,104 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_discovery_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the discovery statistics are returned."""
+    entry = MockConfigEntry(domain=DOMAIN, title="Profiler")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    discovery_flow.async_get_cache(hass).async_record_started("zeroconf")
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/discovery_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["zeroconf"]["flows_started"] == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_storage_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the storage write statistics are returned."""
+    entry = MockConfigEntry(domain=DOMAIN, title="Profiler")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    stats = {"core.restore_state": {"writes": 2, "skipped": 1, "bytes_written": 100}}
+    client = await hass_ws_client(hass)
+    with patch(
+        "homeassistant.components.profiler.storage.async_get_write_stats",
+        return_value=stats,
+    ):
+        await client.send_json_auto_id({"type": "profiler/storage_stats"})
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == stats
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_service_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the entity service statistics are returned."""
+    entry = MockConfigEntry(domain=DOMAIN, title="Profiler")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    stats = {"light.turn_on": {"count": 2, "total": 0.5, "max": 0.4}}
+    client = await hass_ws_client(hass)
+    with patch(
+        "homeassistant.components.profiler.async_get_entity_service_stats",
+        return_value=stats,
+    ):
+        await client.send_json_auto_id({"type": "profiler/service_stats"})
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == stats
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_loop_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the loop monitor runs while the profiler is set up."""
+    entry = MockConfigEntry(domain=DOMAIN, title="Profiler")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.profiler_event_loop_lag").state == "0.0"
+    assert hass.states.get("sensor.profiler_slow_callbacks").state == "0"
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["lag"]["max"] == 0
+    assert response["result"]["slow_callbacks"] == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_running"
@@ -79,6 +79,43 @@ async def test_reloadable(hass: HomeAssistant, start_ha) -> None:
     assert hass.states.get("sensor.top_level_2").state == "reload"
 
 
+@pytest.mark.parametrize(("count", "domain"), [(1, DOMAIN)])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "template": {
+                "trigger": {"platform": "event", "event_type": "event_1"},
+                "sensor": {
+                    "name": "top level",
+                    "state": "{{ trigger.event.data.source }}",
+                },
+            },
+        },
+    ],
+)
+async def test_reload_keeps_unchanged_trigger_sections(
+    hass: HomeAssistant, start_ha
+) -> None:
+    """Test reload only recreates the coordinators of changed trigger sections."""
+    hass.bus.async_fire("event_1", {"source": "init"})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.top_level").state == "init"
+    coordinator = hass.data[DOMAIN][0]
+
+    await async_yaml_patch_helper(hass, "trigger_configuration.yaml")
+
+    assert len(hass.data[DOMAIN]) == 2
+    assert hass.data[DOMAIN][0] is coordinator
+    assert hass.states.get("sensor.top_level").state == "init"
+
+    hass.bus.async_fire("event_1", {"source": "after reload"})
+    hass.bus.async_fire("event_2", {"source": "reload"})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.top_level").state == "after reload"
+    assert hass.states.get("sensor.top_level_2").state == "reload"
+
+
 @pytest.mark.parametrize(("count", "domain"), [(1, "sensor")])
 @pytest.mark.parametrize(
     "config",
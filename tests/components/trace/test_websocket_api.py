@@ -9,9 +9,19 @@ from unittest.mock import patch
 import pytest
 from pytest_unordered import unordered
 
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.automation.trace import trace_automation
+from homeassistant.components.script.trace import trace_script
+from homeassistant.components.trace.const import (
+    CONF_SAMPLE_INTERVAL,
+    CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_STORED_TRACES,
+    TRACE_MODE_OFF,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.helpers.trace import trace_enabled_get
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.setup import async_setup_component
 from homeassistant.util.uuid import random_uuid_hex
@@ -47,7 +57,11 @@ async def _setup_automation_or_script(
 ) -> None:
     """Set up automations or scripts from automation config."""
     if domain == "script":
-        configs = {config["id"]: {"sequence": config["action"]} for config in configs}
+        configs = {
+            config["id"]: {"sequence": config["action"]}
+            | ({"trace": config["trace"]} if "trace" in config else {})
+            for config in configs
+        }
 
     if script_config:
         if domain == "automation":
@@ -788,6 +802,90 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_modes(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test tracing only some runs of a script or automation."""
+    await async_setup_component(hass, "homeassistant", {})
+    msg_id = 1
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": {"mode": "sampled", "sample_interval": 2},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"service": "test.automation"},
+        "trace": {"mode": "sampled", "sample_interval": 0},
+    }
+    star_config = {
+        "id": "star",
+        "trigger": {"platform": "event", "event_type": "test_event3"},
+        "action": {"event": "some_event"},
+        "trace": {"mode": "off"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config, moon_config, star_config]
+    )
+
+    client = await hass_ws_client()
+
+    for _ in range(3):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await _run_automation_or_script(hass, domain, star_config, "test_event3")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+
+    # Every second run is traced in full
+    sun_traces = _find_traces(response["result"], domain, "sun")
+    assert len(sun_traces) == 2
+    assert all(trace["last_step"] is not None for trace in sun_traces)
+
+    # Only runs ending with an error are kept, without trace elements
+    moon_traces = _find_traces(response["result"], domain, "moon")
+    assert len(moon_traces) == 3
+    assert all(trace["script_execution"] == "error" for trace in moon_traces)
+    assert all(trace["last_step"] is None for trace in moon_traces)
+
+    assert _find_traces(response["result"], domain, "star") == []
+
+
+async def test_trace_mode_restored_after_run(hass: HomeAssistant) -> None:
+    """Test the trace mode of a run does not leak to the calling run."""
+    assert await async_setup_component(hass, "trace", {})
+    trace_config = {
+        CONF_STORED_TRACES: DEFAULT_STORED_TRACES,
+        CONF_TRACE_MODE: TRACE_MODE_OFF,
+        CONF_SAMPLE_INTERVAL: DEFAULT_SAMPLE_INTERVAL,
+    }
+    with trace_automation(hass, "sun", None, None, Context(), trace_config):
+        assert not trace_enabled_get()
+        with trace_script(
+            hass,
+            "moon",
+            None,
+            None,
+            Context(),
+            trace_config | {CONF_TRACE_MODE: "full"},
+        ):
+            assert trace_enabled_get()
+        assert not trace_enabled_get()
+    assert trace_enabled_get()
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
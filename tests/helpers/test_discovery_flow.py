@@ -8,7 +8,11 @@ import pytest
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers import discovery_flow
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from tests.common import MockConfigEntry
 
 
 @pytest.fixture
@@ -118,3 +122,54 @@ async def test_async_create_flow_does_nothing_after_stop(
         {"properties": {"id": "aa:bb:cc:dd:ee:ff"}},
     )
     assert len(mock_flow_init.mock_calls) == 0
+
+
+async def test_async_create_flow_skips_configured_discovery(
+    hass: HomeAssistant,
+) -> None:
+    """Test discoveries of configured devices do not start flows again."""
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    context = {"source": config_entries.SOURCE_HOMEKIT}
+    data = {"properties": {"id": "aa:bb:cc:dd:ee:ff"}}
+
+    with patch.object(
+        hass.config_entries.flow,
+        "async_init",
+        return_value={"type": FlowResultType.ABORT, "reason": "already_configured"},
+    ) as mock_init:
+        discovery_flow.async_create_flow(hass, "hue", context, data)
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 1
+
+        discovery_flow.async_create_flow(hass, "hue", context, data)
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 1
+
+        # Other discovery data is still passed to a flow
+        discovery_flow.async_create_flow(
+            hass, "hue", context, {"properties": {"id": "11:22:33:44:55:66"}}
+        )
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 2
+
+        # Removing an entry of the domain makes the device discoverable again
+        async_dispatcher_send(
+            hass,
+            config_entries.SIGNAL_CONFIG_ENTRY_CHANGED,
+            config_entries.ConfigEntryChange.REMOVED,
+            MockConfigEntry(domain="hue"),
+        )
+        discovery_flow.async_create_flow(hass, "hue", context, data)
+        await hass.async_block_till_done()
+        assert len(mock_init.mock_calls) == 3
+
+    stats = discovery_flow.async_get_cache(hass).async_get_stats()
+    assert stats == {
+        "homekit": {
+            "discovered": 4,
+            "flows_started": 3,
+            "skipped": 1,
+            "rate": 4 / discovery_flow.DISCOVERY_RATE_WINDOW,
+        }
+    }
@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_keyed_listener_counts,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -537,6 +538,27 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_keyed_listener_counts(hass: HomeAssistant) -> None:
+    """Test the number of keys and listeners of keyed trackers is reported."""
+    assert async_get_keyed_listener_counts(hass) == {}
+
+    unsub_1 = async_track_state_change_event(
+        hass, ["light.kitchen", "light.bedroom"], lambda event: None
+    )
+    unsub_2 = async_track_state_change_event(hass, "light.kitchen", lambda event: None)
+    assert async_get_keyed_listener_counts(hass) == {
+        "track_state_change_data": {
+            "event_type": EVENT_STATE_CHANGED,
+            "keys": 2,
+            "listeners": 3,
+        }
+    }
+
+    unsub_1()
+    unsub_2()
+    assert async_get_keyed_listener_counts(hass) == {}
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,54 @@
+"""Tests for the loop monitor helper."""
+
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import loop_monitor
+
+
+async def test_listener_run_time(hass: HomeAssistant) -> None:
+    """Test the run time of sampled listener jobs is recorded."""
+    monitor = loop_monitor.async_get(hass)
+
+    @callback
+    def _listener(event: Event) -> None:
+        """Listen for the test event."""
+
+    hass.bus.async_listen("test_event", _listener)
+
+    with patch.object(loop_monitor, "SAMPLE_RATE", 2):
+        monitor.async_start()
+    assert monitor.running
+
+    for _ in range(4):
+        hass.bus.async_fire("test_event")
+
+    stats = monitor.async_get_stats()
+    name = f"{__name__}.test_listener_run_time.<locals>._listener"
+    assert stats["listeners"][name]["count"] == 2
+    assert stats["listeners"][name]["integration"] is None
+    assert sum(stats["listeners"][name]["histogram"].values()) == 2
+    assert stats["event_types"]["test_event"]["listeners"] == 1
+    assert stats["event_types"]["test_event"]["sampled"] == 2
+
+    monitor.async_stop()
+    assert not monitor.running
+    hass.bus.async_fire("test_event")
+    assert monitor.async_get_stats()["listeners"][name]["count"] == 2
+
+
+async def test_stops_with_home_assistant(hass: HomeAssistant) -> None:
+    """Test the monitor stops when Home Assistant stops."""
+    monitor = loop_monitor.async_get(hass)
+    monitor.async_start()
+    assert monitor.async_get_lag() == {
+        "current": 0.0,
+        "max": 0.0,
+        "p50": 0.0,
+        "p95": 0.0,
+    }
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert not monitor.running
@@ -0,0 +1,104 @@
+"""Tests for the poll scheduler helper."""
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import poll_scheduler
+from homeassistant.helpers.event import RANDOM_MICROSECOND_MAX, RANDOM_MICROSECOND_MIN
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed, async_fire_time_changed_exact
+
+
+def test_poll_offset() -> None:
+    """Test the offset is stable and spread over the slots."""
+    assert poll_scheduler.poll_offset("a") == poll_scheduler.poll_offset("a")
+    offsets = {poll_scheduler.poll_offset(f"poller {i}") for i in range(100)}
+    assert len(offsets) == poll_scheduler.SLOTS
+    assert min(offsets) >= RANDOM_MICROSECOND_MIN / 10**6
+    assert max(offsets) <= RANDOM_MICROSECOND_MAX / 10**6
+
+
+async def test_schedule_and_cancel(hass: HomeAssistant) -> None:
+    """Test pollers due together share a timer and can be cancelled."""
+    scheduler = poll_scheduler.async_get(hass)
+    calls: list[str] = []
+
+    # Only the first poll of a poller is offset
+    scheduler.async_schedule(1, "poller", 0, lambda: calls.append("initial"))
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert calls == ["initial"]
+
+    scheduler.async_schedule(1, "poller", 10, lambda: calls.append("first"))
+    cancel = scheduler.async_schedule(1, "poller", 10, lambda: calls.append("second"))
+    scheduler.async_schedule(1, "poller", 20, lambda: calls.append("third"))
+    assert len(scheduler._slots) == 2
+
+    cancel()
+    cancel()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    assert calls == ["initial", "first"]
+    assert len(scheduler._slots) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    assert calls == ["initial", "first", "third"]
+    assert not scheduler._slots
+
+
+async def test_sub_second_interval(hass: HomeAssistant) -> None:
+    """Test polls with a sub-second interval are not due before their delay."""
+    scheduler = poll_scheduler.async_get(hass)
+    calls: list[str] = []
+
+    scheduler.async_schedule(1, "poller", 0, lambda: calls.append("initial"))
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    assert calls == ["initial"]
+
+    now = hass.loop.time()
+    scheduler.async_schedule(1, "poller", 0.25, lambda: calls.append("next"))
+    (slot,) = scheduler._slots.values()
+    assert now + 0.25 <= slot.handle.when() <= now + 0.25 + 1 / poll_scheduler.SLOTS
+
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=0.2))
+    assert calls == ["initial"]
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=0.4))
+    assert calls == ["initial", "next"]
+
+
+async def test_stats(hass: HomeAssistant) -> None:
+    """Test the statistics of the pollers."""
+    scheduler = poll_scheduler.async_get(hass)
+    scheduler.async_schedule(1, "poller", 10, lambda: None, "entry_id")
+    scheduler.async_schedule(2, "poller", 10, lambda: None)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+
+    scheduler.async_record_run(1, 2.0)
+    scheduler.async_record_run(1, 1.0)
+    scheduler.async_record_overrun(1)
+
+    # Pollers with the same name are kept apart
+    assert len(scheduler.async_get_stats()) == 2
+    (stats,) = scheduler.async_get_stats("entry_id")
+    assert stats["name"] == "poller"
+    assert stats["config_entry_id"] == "entry_id"
+    assert stats["interval"] == 10
+    assert stats["runs"] == 2
+    assert stats["overruns"] == 1
+    assert stats["last_duration"] == 1.0
+    assert stats["max_duration"] == 2.0
+    assert stats["total_duration"] == 3.0
+    assert stats["max_delay"] >= stats["last_delay"] >= 0
+
+
+async def test_remove_poller(hass: HomeAssistant) -> None:
+    """Test the statistics of a poller are dropped when it stops polling."""
+    scheduler = poll_scheduler.async_get(hass)
+    cancel = scheduler.async_schedule(1, "poller", 10, lambda: None)
+    cancel()
+    scheduler.async_remove_poller(1)
+    assert scheduler.async_get_stats() == []
+
+    # Late results of a removed poller are ignored
+    scheduler.async_record_run(1, 1.0)
+    scheduler.async_record_overrun(1)
+    assert scheduler.async_get_stats() == []
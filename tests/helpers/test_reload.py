@@ -17,6 +17,7 @@ from homeassistant.helpers.reload import (
     async_integration_yaml_config,
     async_reload_integration_platforms,
     async_setup_reload_service,
+    config_fingerprint,
 )
 from homeassistant.loader import async_get_integration
 
@@ -275,3 +276,14 @@ async def test_async_integration_missing_yaml_config(hass: HomeAssistant) -> Non
         patch.object(config, "YAML_CONFIG_FILE", yaml_path),
     ):
         await async_integration_yaml_config(hass, DOMAIN)
+
+
+def test_config_fingerprint() -> None:
+    """Test fingerprinting configuration blocks."""
+    config_1 = {"alias": "Test", "trigger": [{"platform": "event", "event_type": "a"}]}
+    config_2 = {"trigger": [{"event_type": "a", "platform": "event"}], "alias": "Test"}
+    config_3 = {"alias": "Test", "trigger": [{"platform": "event", "event_type": "b"}]}
+
+    assert config_fingerprint(config_1) == config_fingerprint(config_2)
+    assert config_fingerprint(config_1) != config_fingerprint(config_3)
+    assert config_fingerprint({"alias": object()}) is None
@@ -1,11 +1,13 @@
 """The tests for the Restore component."""
 
 from collections.abc import Coroutine
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,7 +19,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_REFRESH_INTERVAL,
     STORAGE_KEY,
+    ExtraStoredData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -391,6 +395,93 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_reuses_unchanged_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states which did not change are not serialized again."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        hass.states.async_set("input_boolean.b1", "on")
+        await data.async_dump_states()
+        freezer.tick(LAST_SEEN_REFRESH_INTERVAL)
+        await data.async_dump_states()
+
+    first, second, third = (call[1][0] for call in mock_write_data.mock_calls)
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert json_round_trip(second[1])["state"]["state"] == "on"
+    # The last seen time is refreshed after a while
+    assert third[0] is not first[0]
+    assert json_round_trip(third[0])["state"] == json_round_trip(first[0])["state"]
+
+
+@dataclass
+class _MockExtraStoredData(ExtraStoredData):
+    """Extra stored data for the tests."""
+
+    value: list[int]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the extra data."""
+        return {"value": self.value}
+
+
+class _ExtraDataRestoreEntity(RestoreEntity):
+    """Restore entity which returns a new extra data object every time."""
+
+    value = [1]
+
+    @property
+    def extra_restore_state_data(self) -> _MockExtraStoredData:
+        """Return the extra data to store."""
+        return _MockExtraStoredData(list(self.value))
+
+
+async def test_dump_reuses_equal_extra_data(hass: HomeAssistant) -> None:
+    """Test extra data equal to that of the last dump is not converted again."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = _ExtraDataRestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+    with (
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data,
+        patch.object(
+            _MockExtraStoredData, "as_dict", autospec=True, return_value={"value": [1]}
+        ) as mock_as_dict,
+    ):
+        await data.async_dump_states()
+        hass.states.async_set("input_boolean.b0", "on")
+        await data.async_dump_states()
+        assert mock_as_dict.call_count == 1
+
+        entity.value = [2]
+        mock_as_dict.return_value = {"value": [2]}
+        await data.async_dump_states()
+        assert mock_as_dict.call_count == 2
+
+    first, second, third = (call[1][0] for call in mock_write_data.mock_calls)
+    assert second[0] is not first[0]
+    assert json_round_trip(second[0])["extra_data"] == {"value": [1]}
+    assert json_round_trip(third[0])["extra_data"] == {"value": [2]}
+
+
 async def test_load_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     entity = RestoreEntity()
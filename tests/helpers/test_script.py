@@ -7,6 +7,7 @@ from functools import reduce
 import logging
 import operator
 from types import MappingProxyType
+from typing import Any
 from unittest import mock
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
@@ -38,6 +39,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -2190,6 +2192,77 @@ async def test_condition_all_cached(hass: HomeAssistant) -> None:
     assert len(script_obj._config_cache) == 2
 
 
+@pytest.mark.parametrize(
+    ("action", "prepare_calls"),
+    [
+        (
+            {
+                "action": "test.script",
+                "data": {"hello": "world"},
+                "target": {"entity_id": "light.kitchen"},
+            },
+            1,
+        ),
+        ({"action": "test.script", "data": {"hello": template.Template("world")}}, 1),
+        ({"action": "test.script", "data": {"hello": "{{ 'world' }}"}}, 2),
+    ],
+)
+async def test_service_params_prepared_once(
+    hass: HomeAssistant, action: dict[str, Any], prepare_calls: int
+) -> None:
+    """Test service calls without dynamic templates are only prepared once."""
+    calls = async_mock_service(hass, "test", "script")
+    sequence = cv.SCRIPT_SCHEMA(action)
+    script_obj = script.Script(
+        hass, sequence, "Test Name", "test_domain", script_mode="parallel", max_runs=2
+    )
+
+    with patch(
+        "homeassistant.helpers.script.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as prepare_call:
+        await script_obj.async_run(context=Context())
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert prepare_call.call_count == prepare_calls
+    assert len(calls) == 2
+    assert calls[0].data["hello"] == calls[1].data["hello"] == "world"
+
+
+async def test_static_service_params_not_shared_between_runs(
+    hass: HomeAssistant,
+) -> None:
+    """Test a service handler changing the service data does not affect other runs."""
+    calls: list[ServiceCall] = []
+
+    @callback
+    def _handle_service(call: ServiceCall) -> None:
+        calls.append(call)
+        call.data["colors"].append("blue")
+        call.data["options"]["brightness"] = 0
+
+    hass.services.async_register("test", "script", _handle_service)
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "action": "test.script",
+            "data": {"colors": ["red"], "options": {"brightness": 255}},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert calls[1].data["colors"] == ["red", "blue"]
+    assert calls[1].data["options"] == {"brightness": 0}
+    params = script_obj._get_static_service_params(0)
+    assert params is not None
+    assert params["service_data"] == {"colors": ["red"], "options": {"brightness": 255}}
+
+
 @pytest.mark.parametrize("count", [3, script.ACTION_TRACE_NODE_MAX_LEN * 2])
 async def test_repeat_count(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, count
@@ -1347,6 +1347,37 @@ async def test_call_with_one_of_required_features(
     assert all(entity in actual for entity in expected)
 
 
+async def test_polled_entity_updated_without_waiting_for_others(
+    hass: HomeAssistant, mock_entities
+) -> None:
+    """Test a polled entity is updated as soon as its own service call is done."""
+    kitchen = mock_entities["light.kitchen"]
+    living_room = mock_entities["light.living_room"]
+    kitchen._values["should_poll"] = True
+    kitchen.async_update_ha_state = AsyncMock()
+    slow_call = asyncio.Event()
+
+    async def test_service(entity: MockEntity, call: ServiceCall) -> None:
+        if entity is living_room:
+            await slow_call.wait()
+
+    task = asyncio.create_task(
+        service.entity_service_call(
+            hass,
+            mock_entities,
+            HassJob(test_service),
+            ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+        )
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert not task.done()
+    kitchen.async_update_ha_state.assert_awaited_once_with(True)
+
+    slow_call.set()
+    await task
+
+
 async def test_call_with_sync_func(hass: HomeAssistant, mock_entities) -> None:
     """Test invoking sync service calls."""
     test_service_mock = Mock(return_value=None)
@@ -1478,6 +1509,28 @@ async def test_call_context_target_specific_no_auth(
     assert err.value.entity_id == "light.kitchen"
 
 
+async def test_entity_service_stats(
+    hass: HomeAssistant, mock_handle_entity_call, mock_entities
+) -> None:
+    """Check the latency of entity service calls is recorded per service."""
+    for entity_id in (ENTITY_MATCH_ALL, "light.kitchen"):
+        await service.entity_service_call(
+            hass,
+            mock_entities,
+            Mock(),
+            ServiceCall("test_domain", "test_service", data={"entity_id": entity_id}),
+        )
+
+    stats = service.async_get_entity_service_stats(hass)
+    assert stats.keys() == {"test_domain.test_service"}
+    assert stats["test_domain.test_service"]["count"] == 5
+    assert (
+        stats["test_domain.test_service"]["total"]
+        >= stats["test_domain.test_service"]["max"]
+        >= 0
+    )
+
+
 async def test_call_no_context_target_all(
     hass: HomeAssistant, mock_handle_entity_call, mock_entities
 ) -> None:
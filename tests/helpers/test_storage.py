@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -21,7 +22,7 @@ from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAs
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import (
@@ -1180,3 +1181,159 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_store_manager_coalesces_writes(tmpdir: py.path.local) -> None:
+    """Test writes of stores are coalesced and unchanged data is not rewritten."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        store1 = storage.Store(hass, MOCK_VERSION, "store1")
+        store2 = storage.Store(hass, MOCK_VERSION, "store2")
+
+        with patch.object(
+            storage._StoreManager,
+            "_write_batch",
+            wraps=storage._StoreManager._write_batch,
+        ) as mock_write_batch:
+            await asyncio.gather(
+                store1.async_save(MOCK_DATA), store2.async_save(MOCK_DATA2)
+            )
+        assert mock_write_batch.call_count == 1
+
+        size = await hass.async_add_executor_job(os.path.getsize, store1.path)
+        stats = store_manager.async_get_write_stats()
+        assert stats["store1"] == {"writes": 1, "skipped": 0, "bytes_written": size}
+        assert stats["store2"]["writes"] == 1
+
+        await store1.async_save(MOCK_DATA)
+        stats = store_manager.async_get_write_stats()
+        assert stats["store1"] == {"writes": 1, "skipped": 1, "bytes_written": size}
+
+        await store1.async_save(MOCK_DATA2)
+        assert store_manager.async_get_write_stats()["store1"]["writes"] == 2
+        assert await store1.async_load() == MOCK_DATA2
+
+        await store1.async_remove()
+        await store1.async_save(MOCK_DATA2)
+        assert store_manager.async_get_write_stats()["store1"]["writes"] == 3
+
+        # The file is written again if it was removed or changed externally
+        await hass.async_add_executor_job(os.unlink, store1.path)
+        await store1.async_save(MOCK_DATA2)
+        assert storage.async_get_write_stats(hass)["store1"]["writes"] == 4
+        assert await hass.async_add_executor_job(os.path.exists, store1.path)
+        await hass.async_stop(force=True)
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = store.path + storage.JOURNAL_SUFFIX
+        data = {
+            "items": [{"id": "1", "name": "one"}, {"id": "2", "name": "two"}],
+            "other": 1,
+        }
+        await store.async_save(data)
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        data = {
+            "items": [{"id": "1", "name": "renamed"}, {"id": "3", "name": "three"}],
+            "other": 2,
+        }
+        await store.async_save(data)
+        journal = await hass.async_add_executor_job(Path(journal_path).read_bytes)
+        # The header and records for two updated items, a removed item and a value
+        assert len(journal.splitlines()) == 5
+        assert b"renamed" in journal
+        assert b"one" not in journal
+        store_manager = storage.get_internal_store_manager(hass)
+        stats = store_manager.async_get_write_stats()[MOCK_KEY]
+        assert stats["writes"] == 2
+
+        # Saving unchanged data does not append to the journal
+        await store.async_save(data)
+        assert store_manager.async_get_write_stats()[MOCK_KEY] == stats | {"skipped": 1}
+
+        # The journal is replayed on load
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == data
+
+        # The final write compacts the journal into a new snapshot
+        store.async_delay_save(lambda: data, 10)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        # A journal which does not belong to the snapshot is ignored
+        await hass.async_add_executor_job(
+            Path(journal_path).write_bytes,
+            b'{"generation":"stale"}\n{"key":"other","value":99}\n',
+        )
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store3.async_load() == data
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted on final write when no save is pending."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = store.path + storage.JOURNAL_SUFFIX
+        await store.async_save({"items": [{"id": "1", "name": "one"}]})
+        data = {"items": [{"id": "1", "name": "one"}, {"id": "2", "name": "two"}]}
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        snapshot = await hass.async_add_executor_job(
+            json_util.load_json_object, store.path
+        )
+        assert snapshot["data"] == data
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == data
+        await hass.async_stop(force=True)
+
+
+async def test_store_manager_preload_in_progress(tmpdir: py.path.local) -> None:
+    """Test a store waits for the preload of its file instead of reading it."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        tmp_storage.join("integration1").write_binary(
+            json_bytes({"data": {"integration1": "integration1"}, "version": 1})
+        )
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            wraps=json_util.load_json,
+        ) as mock_load_json:
+            preload = hass.async_create_task(
+                store_manager.async_preload(["integration1"]), eager_start=True
+            )
+            assert store_manager.async_get_preload("integration1") is not None
+            store = storage.Store(hass, 1, "integration1")
+            assert await store.async_load() == {"integration1": "integration1"}
+            await preload
+
+        assert mock_load_json.call_count == 1
+        assert store_manager.async_get_preload("integration1") is None
+        assert "integration1" in store_manager.async_get_preload_timings()
+        await hass.async_stop(force=True)
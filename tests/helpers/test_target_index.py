@@ -0,0 +1,149 @@
+"""Tests for the target index helper."""
+
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+    target_index,
+)
+
+from tests.common import MockConfigEntry
+
+
+async def test_area_entities(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test resolving the entities of an area."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    index = target_index.async_get(hass)
+
+    area = area_registry.async_get_or_create("Kitchen")
+    other_area = area_registry.async_get_or_create("Hallway")
+    assert index.async_area_entities(area.id) == ()
+
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=area.id)
+    entity_registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id=device.id
+    )
+    entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        config_entry=config_entry,
+        device_id=device.id,
+        entity_category=EntityCategory.CONFIG,
+    )
+    moved = entity_registry.async_get_or_create(
+        "light", "hue", "9012", config_entry=config_entry, device_id=device.id
+    )
+    entity_registry.async_update_entity(moved.entity_id, area_id=other_area.id)
+
+    assert index.async_area_entities(area.id) == (
+        "light.hue_1234",
+        "light.hue_5678",
+    )
+    assert index.async_area_entities(area.id, visible_only=True) == ("light.hue_1234",)
+    assert index.async_area_entities(other_area.id) == ("light.hue_9012",)
+    assert index.async_device_entities(device.id, without_area=True) == (
+        "light.hue_1234",
+        "light.hue_5678",
+    )
+
+    # The cached result is dropped when a registry is updated
+    entity_registry.async_update_entity(moved.entity_id, area_id=None)
+    assert index.async_area_entities(other_area.id) == ()
+    assert "light.hue_9012" in index.async_area_entities(area.id)
+
+
+async def test_floor_areas_and_label_entities(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+    label_registry: lr.LabelRegistry,
+) -> None:
+    """Test resolving the areas of a floor and the entities of a label."""
+    index = target_index.async_get(hass)
+
+    floor = floor_registry.async_create("First floor")
+    area = area_registry.async_get_or_create("Kitchen")
+    assert index.async_floor_areas(floor.floor_id) == ()
+    area_registry.async_update(area.id, floor_id=floor.floor_id)
+    assert index.async_floor_areas(floor.floor_id) == (area.id,)
+
+    label = label_registry.async_create("Lights")
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+    assert index.async_label_entities(label.label_id) == ()
+    entity_registry.async_update_entity(
+        entry.entity_id, labels={label.label_id}, hidden_by=er.RegistryEntryHider.USER
+    )
+    assert index.async_label_entities(label.label_id) == ("light.hue_1234",)
+    assert index.async_label_entities(label.label_id, visible_only=True) == ()
+
+
+async def test_registry_updates_drop_affected_results(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+) -> None:
+    """Test only the results referencing an updated item are dropped."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    index = target_index.async_get(hass)
+
+    kitchen = area_registry.async_get_or_create("Kitchen")
+    hallway = area_registry.async_get_or_create("Hallway")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entity_registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id=device.id
+    )
+    other = entity_registry.async_get_or_create("light", "hue", "5678")
+    entity_registry.async_update_entity(other.entity_id, area_id=hallway.id)
+
+    hallway_entities = index.async_area_entities(hallway.id)
+    assert hallway_entities == ("light.hue_5678",)
+    assert index.async_area_entities(kitchen.id) == ()
+
+    # Moving the device drops the results of its new area only
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    assert index.async_area_entities(kitchen.id) == ("light.hue_1234",)
+    assert index.async_area_entities(hallway.id) is hallway_entities
+
+    # Renaming an entity drops the results it is part of
+    entity_registry.async_update_entity(other.entity_id, new_entity_id="light.renamed")
+    assert index.async_area_entities(hallway.id) == ("light.renamed",)
+
+    # Removing an entity drops the results it was part of
+    entity_registry.async_remove("light.renamed")
+    assert index.async_area_entities(hallway.id) == ()
+
+    # Moving the device back drops the results of its old area
+    device_registry.async_update_device(device.id, area_id=None)
+    assert index.async_area_entities(kitchen.id) == ()
+
+    # Moving an area to another floor drops the results of both floors
+    first = floor_registry.async_create("First floor")
+    second = floor_registry.async_create("Second floor")
+    area_registry.async_update(kitchen.id, floor_id=first.floor_id)
+    assert index.async_floor_areas(first.floor_id) == (kitchen.id,)
+    assert index.async_floor_areas(second.floor_id) == ()
+    area_registry.async_update(kitchen.id, floor_id=second.floor_id)
+    assert index.async_floor_areas(first.floor_id) == ()
+    assert index.async_floor_areas(second.floor_id) == (kitchen.id,)
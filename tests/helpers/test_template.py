@@ -1807,6 +1807,19 @@ def test_render_with_possible_json_value_with_valid_json(hass: HomeAssistant) ->
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_with_decoded_json(
+    hass: HomeAssistant,
+) -> None:
+    """Render with possible JSON value with the JSON already decoded."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}', variables={"value_json": {"hello": "decoded"}}
+        )
+        == "decoded"
+    )
+
+
 def test_render_with_possible_json_value_with_invalid_json(hass: HomeAssistant) -> None:
     """Render with possible JSON value with invalid JSON."""
     tpl = template.Template("{{ value_json }}", hass)
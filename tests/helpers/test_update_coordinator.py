@@ -18,7 +18,7 @@ from homeassistant.exceptions import (
     ConfigEntryError,
     ConfigEntryNotReady,
 )
-from homeassistant.helpers import update_coordinator
+from homeassistant.helpers import poll_scheduler, update_coordinator
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -141,6 +141,8 @@ async def test_shutdown(
     await crd.async_refresh()
     assert updates == [2]
     assert crd._unsub_refresh is not None
+    scheduler = poll_scheduler.async_get(hass)
+    assert [stats["name"] for stats in scheduler.async_get_stats()] == ["test"]
 
     # Test shutdown through function
     with patch.object(crd._debounced_refresh, "async_shutdown") as mock_shutdown:
@@ -152,6 +154,7 @@ async def test_shutdown(
     # Test we shutdown the debouncer and cleared the subscriptions
     assert len(mock_shutdown.mock_calls) == 1
     assert crd._unsub_refresh is None
+    assert scheduler.async_get_stats() == []
 
     await crd.async_refresh()
     assert updates == [2]
@@ -795,3 +798,81 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_adaptive_update_interval(hass: HomeAssistant) -> None:
+    """Test the update interval backs off while the data doesn't change."""
+    data = 1
+    update_method = AsyncMock(side_effect=lambda: data)
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=update_method,
+        update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=30),
+    )
+    crd.async_add_listener(lambda: None)
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=10)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert update_method.call_count == 2
+    assert crd.current_update_interval == timedelta(seconds=20)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert update_method.call_count == 3
+    assert crd.current_update_interval == timedelta(seconds=30)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert update_method.call_count == 4
+    assert crd.current_update_interval == timedelta(seconds=30)
+
+    # Changed data snaps back to the update interval
+    data = 2
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert update_method.call_count == 5
+    assert crd.current_update_interval == timedelta(seconds=10)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert crd.current_update_interval == timedelta(seconds=20)
+
+    # A refresh which was not scheduled snaps back as well
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=10)
+    await crd.async_shutdown()
+
+
+async def test_only_update_changed_contexts(hass: HomeAssistant) -> None:
+    """Test only the listeners of changed keys are updated."""
+    data = {"a": 1, "b": 1}
+    crd = update_coordinator.DataUpdateCoordinator[dict[str, int]](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=AsyncMock(side_effect=lambda: dict(data)),
+        only_update_changed_contexts=True,
+    )
+    updates: list[str | None] = []
+    for context in ("a", "b", "c", None):
+        crd.async_add_listener(lambda context=context: updates.append(context), context)
+
+    await crd.async_refresh()
+    assert updates == ["a", "b", "c", None]
+
+    updates.clear()
+    await crd.async_refresh()
+    assert updates == []
+
+    data["b"] = 2
+    await crd.async_refresh()
+    assert updates == ["b", None]
+
+    updates.clear()
+    crd.async_set_updated_data({"a": 1, "b": 2, "c": 3})
+    assert updates == ["c", None]
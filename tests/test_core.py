@@ -90,6 +90,8 @@ def test_split_entity_id() -> None:
         ha.split_entity_id("empty_object_id.")
     with pytest.raises(ValueError):
         ha.split_entity_id(".empty_domain")
+    # The domain is shared between entity ids
+    assert ha.split_entity_id("shared.one")[0] is ha.split_entity_id("shared.two")[0]
 
 
 async def test_async_add_hass_job_schedule_callback() -> None:
@@ -1074,6 +1076,21 @@ def test_state_as_compressed_state() -> None:
     assert state.as_compressed_state == expected
 
 
+def test_state_expire_drops_compressed_state() -> None:
+    """Test an expired State no longer holds its compressed forms."""
+    state = ha.State("happy.happy", "on", {"pig": "dog"})
+    compressed_state = state.as_compressed_state
+    compressed_state_json = state.as_compressed_state_json
+    as_dict_json = state.as_dict_json
+
+    state.expire()
+    assert "as_compressed_state" not in state.__dict__
+    assert "as_compressed_state_json" not in state.__dict__
+    assert state.as_dict_json is as_dict_json
+    assert state.as_compressed_state == compressed_state
+    assert state.as_compressed_state_json == compressed_state_json
+
+
 def test_state_as_compressed_state_unique_last_updated() -> None:
     """Test a State as compressed state where last_changed is not last_updated."""
     last_changed = datetime(1984, 12, 8, 11, 0, 0, tzinfo=dt_util.UTC)